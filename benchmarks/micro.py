@@ -0,0 +1,196 @@
+import argparse
+import json
+import sys
+import timeit
+from os import path
+
+from kundalini import Vector
+from kundalini.matrix import Matrix, Matrix4
+
+__all__ = ['CASES', 'compare', 'run']
+
+BASELINE = path.join(path.dirname(path.abspath(__file__)), 'baselines', 'micro.json')
+SIZES = {'scalar': 1, 'batch': 1000}
+
+
+#-----------------------------------------------------------------------
+def _vectors(size:int) -> list:
+    return [Vector([3. + i % 7, 4., 5.]) for i in range(size)]
+
+
+#-----------------------------------------------------------------------
+def construction(size:int):
+    values = [[3. + i % 7, 4., 5.] for i in range(size)]
+    if size == 1:
+        value = values[0]
+        return lambda: Vector(value)
+    return lambda: Vector.batch(values)
+
+
+#-----------------------------------------------------------------------
+def magnitude(size:int):
+    vectors = _vectors(size)
+    return lambda: [vector.magnitude for vector in vectors]
+
+
+#-----------------------------------------------------------------------
+def angles(size:int):
+    vectors = _vectors(size)
+    return lambda: [vector.angles for vector in vectors]
+
+
+#-----------------------------------------------------------------------
+def from_angles(size:int):
+    angles = [(30. + i % 7, 40.) for i in range(size)]
+    return lambda: [Vector.from_angles(angle) for angle in angles]
+
+
+#-----------------------------------------------------------------------
+def transform(size:int):
+    matrix = Matrix.make_xyz_rotate(30., 40., 50.)
+    vectors = _vectors(size)
+    return lambda: [matrix.transform(vector) for vector in vectors]
+
+
+#-----------------------------------------------------------------------
+def make_translation(size:int):
+    vectors = _vectors(size)
+    return lambda: [Matrix.make_translation(vector) for vector in vectors]
+
+
+#-----------------------------------------------------------------------
+def make_xyz_rotate(size:int):
+    angles = [(30. + i % 7, 40., 50.) for i in range(size)]
+    return lambda: [Matrix.make_xyz_rotate(*angle) for angle in angles]
+
+
+#-----------------------------------------------------------------------
+def matrix4_transform(size:int):
+    matrix = Matrix4.make_xyz_rotate(30., 40., 50.)
+    if size == 1:
+        vector = _vectors(1)[0]
+        return lambda: matrix.transform(vector)
+    points = Vector.batch(_vectors(size))
+    return lambda: matrix.transform(points)
+
+
+#-----------------------------------------------------------------------
+def matrix4_make_translation(size:int):
+    vectors = _vectors(size)
+    return lambda: [Matrix4.make_translation(vector) for vector in vectors]
+
+
+#-----------------------------------------------------------------------
+def matrix4_make_xyz_rotate(size:int):
+    angles = [(30. + i % 7, 40., 50.) for i in range(size)]
+    return lambda: [Matrix4.make_xyz_rotate(*angle) for angle in angles]
+
+
+#-----------------------------------------------------------------------
+def matrix4_chain(size:int):
+    matrices = [
+        Matrix4.make_xyz_rotate(30., 40., 50.),
+        Matrix4.make_translation(Vector([1., 2., 3.])),
+    ] * size
+    return lambda: Matrix4.chain(*matrices)
+
+
+#-----------------------------------------------------------------------
+def matrix4_inverse(size:int):
+    matrices = [
+        Matrix4.chain(Matrix4.make_xyz_rotate(30. + i % 7, 40., 50.), Matrix4())
+        for i in range(size)
+    ]
+    return lambda: [matrix.inverse(rigid=True) for matrix in matrices]
+
+
+CASES = {
+    case.__name__: case
+    for case in [
+        construction, magnitude, angles, from_angles,
+        transform, make_translation, make_xyz_rotate,
+        matrix4_transform, matrix4_make_translation, matrix4_make_xyz_rotate,
+        matrix4_chain, matrix4_inverse,
+    ]
+}
+
+
+#-----------------------------------------------------------------------
+def run(cases:list=None, repeat:int=5) -> dict:
+    # Best of `repeat` rounds, in seconds per call of the case
+    results = {}
+    for name in cases or CASES:
+        for label, size in SIZES.items():
+            timer = timeit.Timer(CASES[name](size))
+            number, _ = timer.autorange()
+            best = min(timer.repeat(repeat=repeat, number=number))
+            results['{}[{}]'.format(name, label)] = best / number
+    return results
+
+
+#-----------------------------------------------------------------------
+def compare(baseline:dict, current:dict, threshold:float) -> list:
+    regressions = []
+    for key in sorted(current):
+        if key not in baseline:
+            print('{:32} {:>12.3f} us      (new)'.format(key, current[key] * 1e6))
+            continue
+        ratio = current[key] / baseline[key]
+        regressed = ratio > 1 + threshold
+        print('{:32} {:>12.3f} us {:>+7.1%}{}'.format(
+            key, current[key] * 1e6, ratio - 1, '  REGRESSION' if regressed else '',
+        ))
+        if regressed:
+            regressions.append(key)
+    return regressions
+
+
+#-----------------------------------------------------------------------
+def main(argv:list=None) -> int:
+    parser = argparse.ArgumentParser(description='Vector and Matrix micro-benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    command = commands.add_parser('run', help='run and store results')
+    command.add_argument('-o', '--output', default=BASELINE)
+    command.add_argument('-r', '--repeat', type=int, default=5)
+    command.add_argument('cases', nargs='*', metavar='case')
+
+    command = commands.add_parser('compare', help='run and compare against a baseline')
+    command.add_argument('-b', '--baseline', default=BASELINE)
+    command.add_argument('-t', '--threshold', type=float, default=.2,
+                         help='tolerated slowdown ratio (default: 0.2)')
+    command.add_argument('-r', '--repeat', type=int, default=5)
+    command.add_argument('cases', nargs='*', metavar='case')
+
+    args = parser.parse_args(argv)
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error('unknown cases: {}'.format(', '.join(sorted(unknown))))
+    results = run(args.cases, args.repeat)
+
+    if args.command == 'run':
+        # Partial runs update their own entries only
+        stored = {}
+        if path.exists(args.output):
+            with open(args.output) as fd:
+                stored = json.load(fd)
+        stored.update(results)
+        with open(args.output, 'w') as fd:
+            json.dump(stored, fd, indent=2, sort_keys=True)
+            fd.write('\n')
+        for key, seconds in sorted(results.items()):
+            print('{:32} {:>12.3f} us'.format(key, seconds * 1e6))
+        return 0
+
+    with open(args.baseline) as fd:
+        baseline = json.load(fd)
+    regressions = compare(baseline, results, args.threshold)
+    if regressions:
+        print('{} regression(s) beyond {:.0%}'.format(len(regressions), args.threshold))
+        return 1
+    return 0
+
+
+#-----------------------------------------------------------------------
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import argparse
+import os
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+from kundalini.particles import ParticleEmitter
+
+__all__ = ['run']
+
+
+#-----------------------------------------------------------------------
+def run(count:int, frames:int) -> float:
+    surface = pygame.Surface((1280, 720), 0, 32)
+    emitter = ParticleEmitter(count, gravity=(0., 98.), seed=0)
+    emitter.emit(count, (640, 360), spread=200., lifetime=10000.)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        emitter.update(1000 / 60)
+        emitter.draw(surface)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+#-----------------------------------------------------------------------
+def main(argv:list=None) -> None:
+    parser = argparse.ArgumentParser(description='Particle update+draw cost per frame')
+    parser.add_argument('-n', '--count', type=int, default=100000)
+    parser.add_argument('-f', '--frames', type=int, default=120)
+    args = parser.parse_args(argv)
+    print('{} particles: {:.2f} ms/frame (budget {:.2f} ms)'.format(
+        args.count, run(args.count, args.frames), 1000 / 60,
+    ))
+
+
+#-----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
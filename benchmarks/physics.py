@@ -0,0 +1,50 @@
+import argparse
+import timeit
+
+from kundalini.physics import Bodies, SemiImplicitEuler, Verlet
+
+__all__ = ['run']
+
+
+#-----------------------------------------------------------------------
+def bodies(count:int, seed:int=0) -> Bodies:
+    import numpy
+    random = numpy.random.default_rng(seed)
+    result = Bodies(count)
+    # About as dense as 10k bodies of radius 2 on a 1000×1000 field
+    side = 1000 * (count / 10000) ** .5
+    result.positions[:] = random.uniform(0, side, (count, 2))
+    result.velocities[:] = random.uniform(-50, 50, (count, 2))
+    result.radii[:] = 2
+    return result
+
+
+#-----------------------------------------------------------------------
+def run(count:int, substeps:int) -> dict:
+    results = {}
+    for integrator in SemiImplicitEuler, Verlet:
+        world = integrator(bodies(count), substeps=substeps, gravity=(0, 98))
+        timer = timeit.Timer(lambda: world.update(1000 / 60))
+        number, _ = timer.autorange()
+        results[integrator.__name__] = min(timer.repeat(5, number)) / number
+
+    world = bodies(count)
+    timer = timeit.Timer(world.collisions)
+    number, _ = timer.autorange()
+    results['sweep_and_prune'] = min(timer.repeat(5, number)) / number
+    return results
+
+
+#-----------------------------------------------------------------------
+def main(argv:list=None) -> None:
+    parser = argparse.ArgumentParser(description='Physics integration cost per frame')
+    parser.add_argument('-n', '--count', type=int, default=10000)
+    parser.add_argument('-s', '--substeps', type=int, default=4)
+    args = parser.parse_args(argv)
+    for name, seconds in run(args.count, args.substeps).items():
+        print('{:20} {:>10.3f} ms  ({} bodies)'.format(name, seconds * 1000, args.count))
+
+
+#-----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import json
+import pkgutil
+import os
+import subprocess
+import sys
+from os import path
+from collections import namedtuple
+
+import kundalini
+
+__all__ = ['Measure', 'entry_points', 'measure']
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+HEAVY = ('numpy', 'pygame', 'OpenGL', 'asyncio')
+ENV = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+
+Measure = namedtuple('Measure', 'entry_point microseconds heavy')
+
+
+#-----------------------------------------------------------------------
+def entry_points() -> list:
+    names = ['kundalini.' + name for name in kundalini.__all__]
+    modules = [
+        'kundalini.' + module.name
+        for module in pkgutil.iter_modules(kundalini.__path__)
+        if module.name != 'tests'
+    ]
+    return names + modules
+
+
+#-----------------------------------------------------------------------
+def statement(entry_point:str) -> str:
+    module, _, name = entry_point.rpartition('.')
+    if name in kundalini.__all__:
+        return 'import {0}; {0}.{1}'.format(module, name)
+    return 'import {}'.format(entry_point)
+
+
+#-----------------------------------------------------------------------
+def measure(entry_point:str, repeat:int=5) -> Measure:
+    code = '{}; import sys; print(",".join(m for m in {!r} if m in sys.modules))'
+    code = code.format(statement(entry_point), HEAVY)
+    best = None
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=ROOT, env=ENV, capture_output=True, text=True,
+        )
+        if process.returncode:
+            # Optional dependency missing (e.g. PyOpenGL)
+            return Measure(entry_point, None, ())
+
+        # Sum of self times is the wall cost of every module imported
+        total = sum(
+            int(line.split('|')[0].split(':')[1])
+            for line in process.stderr.splitlines()
+            if line.startswith('import time:') and '[us]' not in line
+        )
+        best = total if best is None else min(best, total)
+    heavy = process.stdout.strip().splitlines()[-1] if process.stdout.strip() else ''
+    heavy = tuple(filter(None, heavy.split(',')))
+    return Measure(entry_point, best, heavy)
+
+
+#-----------------------------------------------------------------------
+def main(argv:list=None) -> None:
+    parser = argparse.ArgumentParser(description='Import cost of kundalini entry points')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('-o', '--output', help='write results as JSON')
+    args = parser.parse_args(argv)
+
+    results = [measure(entry_point, args.repeat) for entry_point in entry_points()]
+    for result in results:
+        if result.microseconds is None:
+            print('{:40} {:>13}'.format(result.entry_point, 'unavailable'))
+        else:
+            print('{:40} {:>10.1f} ms  {}'.format(
+                result.entry_point, result.microseconds / 1000, ' '.join(result.heavy),
+            ))
+
+    if args.output:
+        with open(args.output, 'w') as fd:
+            json.dump({
+                result.entry_point: {
+                    'microseconds': result.microseconds,
+                    'heavy': list(result.heavy),
+                }
+                for result in results
+            }, fd, indent=2, sort_keys=True)
+
+
+#-----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,36 @@
-from .frame_management import FrameManager
-from .vector import Vector
+from importlib import import_module
+
+__all__ = [
+    'FrameManager', 'Scene', 'Event', 'Surface',
+    'Vector',
+    'get_dtype', 'set_dtype',
+]
+
+# Public names are resolved on first access, so math-only users never
+# pay for pygame or OpenGL
+_lazy = {
+    'FrameManager': 'frame_management',
+    'Scene': 'frame_management',
+    'Event': 'frame_management',
+    'Surface': 'frame_management',
+    'Vector': 'vector',
+    'get_dtype': 'dtype',
+    'set_dtype': 'dtype',
+}
+
+
+#-----------------------------------------------------------------------
+def __getattr__(name:str):
+    try:
+        module = _lazy[name]
+    except KeyError:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name)) from None
+
+    value = getattr(import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+#-----------------------------------------------------------------------
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,199 @@
+import argparse
+import io
+import json
+import mmap
+import os
+import struct
+from os import path
+
+__all__ = ['AssetPack', 'build']
+
+# Layout: header, asset bytes back to back, JSON index
+#   header = MAGIC, version, index offset, index length
+MAGIC = b'KPAK'
+VERSION = 1
+HEADER = struct.Struct('<4sIQQ')
+ALIGNMENT = 16
+
+
+#-----------------------------------------------------------------------
+def build(output:str, sources:list, *, root:str=None) -> dict:
+    files = []
+    for source in sources:
+        if path.isdir(source):
+            base = root or source
+            for dirpath, dirnames, filenames in os.walk(source):
+                dirnames.sort()
+                files.extend(
+                    (path.join(dirpath, filename), base)
+                    for filename in sorted(filenames)
+                )
+        else:
+            files.append((source, root or path.dirname(source)))
+
+    # Names are checked before writing anything, and the archive is
+    # written aside: a failed build never leaves a partial pack behind
+    names = {}
+    for filename, base in files:
+        name = path.relpath(filename, base).replace(os.sep, '/')
+        if name in names:
+            raise ValueError('duplicated asset: {}'.format(name))
+        names[name] = filename
+
+    index = {}
+    temporary = output + '.tmp'
+    try:
+        with open(temporary, 'wb') as fd:
+            fd.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+            for name, filename in names.items():
+                offset = fd.tell()
+                padding = -offset % ALIGNMENT
+                fd.write(b'\0' * padding)
+                offset += padding
+                with open(filename, 'rb') as source:
+                    data = source.read()
+                fd.write(data)
+                index[name] = [offset, len(data)]
+
+            offset = fd.tell()
+            encoded = json.dumps(index, sort_keys=True).encode('utf-8')
+            fd.write(encoded)
+            fd.seek(0)
+            fd.write(HEADER.pack(MAGIC, VERSION, offset, len(encoded)))
+        os.replace(temporary, output)
+
+    except:
+        if path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+    return index
+
+
+#-----------------------------------------------------------------------
+class AssetPack:
+
+    def __init__(self, filename:str):
+        self.filename = filename
+        with open(filename, 'rb') as fd:
+            self.__map = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.index = self.__read_index()
+        except:
+            self.__map.close()
+            raise
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    def __contains__(self, name:str) -> bool:
+        return name in self.index
+
+
+    def __iter__(self):
+        return iter(self.index)
+
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+    def __getitem__(self, name:str) -> memoryview:
+        # Slicing the mapping copies nothing: pages are read from disk
+        # only when the view is consumed
+        offset, length = self.index[name]
+        return memoryview(self.__map)[offset:offset + length]
+
+
+    def open(self, name:str) -> io.BufferedReader:
+        return io.BufferedReader(_ViewReader(self[name]))
+
+
+    def load_image(self, name:str):
+        import pygame
+        return pygame.image.load(self.open(name), name)
+
+
+    def load_sound(self, name:str):
+        import pygame
+        return pygame.mixer.Sound(file=self.open(name))
+
+
+    def close(self) -> None:
+        # Raises BufferError, leaving the pack open, while views handed
+        # out are still alive
+        if not self.__map.closed:
+            self.__map.close()
+
+
+    def __read_index(self) -> dict:
+        mapping = self.__map
+        if len(mapping) < HEADER.size:
+            raise ValueError('not an asset pack: {}'.format(self.filename))
+        magic, version, offset, length = HEADER.unpack_from(mapping)
+        if magic != MAGIC:
+            raise ValueError('not an asset pack: {}'.format(self.filename))
+        if version != VERSION:
+            raise ValueError('unsupported asset pack version: {}'.format(version))
+        if offset + length > len(mapping):
+            raise ValueError('truncated asset pack: {}'.format(self.filename))
+        return json.loads(mapping[offset:offset + length].decode('utf-8'))
+
+
+#-----------------------------------------------------------------------
+class _ViewReader(io.RawIOBase):
+
+    def __init__(self, view:memoryview):
+        self.view = view
+        self.position = 0
+
+
+    def readable(self) -> bool:
+        return True
+
+
+    def seekable(self) -> bool:
+        return True
+
+
+    def readinto(self, buffer) -> int:
+        data = self.view[self.position:self.position + len(buffer)]
+        size = len(data)
+        buffer[:size] = data
+        self.position += size
+        return size
+
+
+    def seek(self, offset:int, whence:int=io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(0, offset)
+        return self.position
+
+
+    def tell(self) -> int:
+        return self.position
+
+
+#-----------------------------------------------------------------------
+def main(argv:list=None) -> None:
+    parser = argparse.ArgumentParser(description='Pack assets into a kundalini asset pack')
+    parser.add_argument('output', help='asset pack to write')
+    parser.add_argument('sources', nargs='+', help='files and directories to pack')
+    parser.add_argument('--root', help='directory asset names are relative to')
+    args = parser.parse_args(argv)
+    index = build(args.output, args.sources, root=args.root)
+    print('{}: {} assets'.format(args.output, len(index)))
+
+
+#-----------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
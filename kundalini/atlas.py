@@ -0,0 +1,203 @@
+import hashlib
+import io
+import json
+import os
+from collections import namedtuple
+from os import path
+import pygame
+
+__all__ = ['Atlas', 'AtlasRegion']
+
+Rect = pygame.rect.Rect
+Surface = pygame.surface.Surface
+
+# Bump when the packing or the cache layout changes
+VERSION = 1
+
+
+#-----------------------------------------------------------------------
+class AtlasRegion(namedtuple('AtlasRegion', 'page rect')):
+
+    @property
+    def size(self) -> tuple:
+        return self.rect.size
+
+
+    def blit(self, target:Surface, dest:tuple, special_flags:int=0) -> Rect:
+        return target.blit(self.page, dest, self.rect, special_flags)
+
+
+    def subsurface(self) -> Surface:
+        return self.page.subsurface(self.rect)
+
+
+#-----------------------------------------------------------------------
+class Atlas:
+
+    def __init__(self, pages:list, layout:dict):
+        self.pages = pages
+        self.regions = {
+            name: AtlasRegion(pages[page], Rect(x, y, width, height))
+            for name, (page, x, y, width, height) in layout.items()
+        }
+
+
+    def __getitem__(self, name:str) -> AtlasRegion:
+        return self.regions[name]
+
+
+    def __contains__(self, name:str) -> bool:
+        return name in self.regions
+
+
+    def __iter__(self):
+        return iter(self.regions)
+
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+
+    def blit(self, target:Surface, name:str, dest:tuple, special_flags:int=0) -> Rect:
+        return self.regions[name].blit(target, dest, special_flags)
+
+
+    @classmethod
+    def build(cls, sources, *, size:tuple=(2048, 2048), padding:int=1,
+              cache_dir:str=None) -> 'Atlas':
+        if not isinstance(sources, dict):
+            sources = {source: source for source in sources}
+        data = {name: _read(source) for name, source in sources.items()}
+        key = _key(data, size, padding)
+
+        if cache_dir:
+            # A cache that fails to load, truncated or with pages gone
+            # missing, is a miss: the atlas is packed and saved again
+            try:
+                atlas = cls.__load_cache(cache_dir, key)
+            except Exception:
+                atlas = None
+            if atlas is not None:
+                return atlas
+
+        images = {
+            name: pygame.image.load(io.BytesIO(content), name)
+            for name, content in data.items()
+        }
+        pages, layout = _pack(images, size, padding)
+        atlas = cls(pages, layout)
+
+        if cache_dir:
+            atlas.__save_cache(cache_dir, key, layout)
+        return atlas
+
+
+    #---------------------------------------------------------------
+    # Internals
+    #
+
+    @classmethod
+    def __load_cache(cls, cache_dir:str, key:str) -> 'Atlas':
+        filename = path.join(cache_dir, key + '.json')
+        if not path.exists(filename):
+            return None
+        with open(filename) as fd:
+            cache = json.load(fd)
+        pages = [
+            _converted(pygame.image.load(path.join(cache_dir, page)))
+            for page in cache['pages']
+        ]
+        return cls(pages, cache['layout'])
+
+
+    def __save_cache(self, cache_dir:str, key:str, layout:dict) -> None:
+        os.makedirs(cache_dir, exist_ok=True)
+        names = []
+        for i, page in enumerate(self.pages):
+            names.append('{}-{}.png'.format(key, i))
+            pygame.image.save(page, path.join(cache_dir, names[-1]))
+        # Layout written last, and renamed into place once complete: its
+        # presence means the pages are complete
+        filename = path.join(cache_dir, key + '.json')
+        with open(filename + '.tmp', 'w') as fd:
+            json.dump({'pages': names, 'layout': layout}, fd, sort_keys=True)
+        os.replace(filename + '.tmp', filename)
+
+
+#-----------------------------------------------------------------------
+def _read(source) -> bytes:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    with open(source, 'rb') as fd:
+        return fd.read()
+
+
+#-----------------------------------------------------------------------
+def _key(data:dict, size:tuple, padding:int) -> str:
+    digest = hashlib.sha1(json.dumps([VERSION, list(size), padding]).encode('utf-8'))
+    for name in sorted(data):
+        digest.update(name.encode('utf-8'))
+        digest.update(hashlib.sha1(data[name]).digest())
+    return digest.hexdigest()
+
+
+#-----------------------------------------------------------------------
+def _pack(images:dict, size:tuple, padding:int) -> tuple:
+    # Shelf packing, tallest images first
+    page_width, page_height = size
+    pages = []
+    layout = {}
+    order = sorted(images, key=lambda name: (-images[name].get_height(), name))
+
+    for name in order:
+        width, height = images[name].get_size()
+        width += padding
+        height += padding
+        if width > page_width or height > page_height:
+            raise ValueError('image does not fit in an atlas page: {}'.format(name))
+
+        for index, shelves in enumerate(pages):
+            position = _place(shelves, width, height, page_width, page_height)
+            if position:
+                break
+        else:
+            pages.append([])
+            index, shelves = len(pages) - 1, pages[-1]
+            position = _place(shelves, width, height, page_width, page_height)
+
+        x, y = position
+        layout[name] = [index, x, y, width - padding, height - padding]
+
+    surfaces = []
+    for index, shelves in enumerate(pages):
+        shelf_y, shelf_height, _ = shelves[-1]
+        surface = Surface((page_width, shelf_y + shelf_height), pygame.SRCALPHA, 32)
+        surface.fill((0, 0, 0, 0))
+        surfaces.append(surface)
+
+    for name, (index, x, y, _, _) in layout.items():
+        surfaces[index].blit(images[name], (x, y))
+
+    return [_converted(surface) for surface in surfaces], layout
+
+
+#-----------------------------------------------------------------------
+def _place(shelves:list, width:int, height:int, page_width:int, page_height:int) -> tuple:
+    for shelf in shelves:
+        y, shelf_height, x = shelf
+        if height <= shelf_height and x + width <= page_width:
+            shelf[2] += width
+            return x, y
+
+    y = shelves[-1][0] + shelves[-1][1] if shelves else 0
+    if y + height > page_height:
+        return None
+    shelves.append([y, height, width])
+    return 0, y
+
+
+#-----------------------------------------------------------------------
+def _converted(surface:Surface) -> Surface:
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
@@ -0,0 +1,28 @@
+import numpy
+from numpy import ascontiguousarray
+
+__all__ = ['get_dtype', 'set_dtype', 'gl_array']
+
+_ACCEPTED = (numpy.float32, numpy.float64)
+__dtype = numpy.float64
+
+
+#-----------------------------------------------------------------------
+def get_dtype() -> type:
+    return __dtype
+
+
+#-----------------------------------------------------------------------
+def set_dtype(dtype:type) -> None:
+    global __dtype
+    dtype = numpy.dtype(dtype).type
+    if dtype not in _ACCEPTED:
+        raise TypeError('unsupported dtype: {}'.format(dtype.__name__))
+    __dtype = dtype
+
+
+#-----------------------------------------------------------------------
+def gl_array(data, dtype:type=None) -> numpy.ndarray:
+    # C-contiguous memory in the library dtype: ready for glLoadMatrix*
+    # and buffer uploads without any further conversion
+    return ascontiguousarray(data, dtype=dtype or __dtype)
@@ -0,0 +1,150 @@
+import numpy
+import pygame
+
+__all__ = ['alpha_gradient', 'fade', 'fade_alpha', 'grade', 'gradient', 'levels', 'remap']
+
+Surface = pygame.surface.Surface
+
+# Every function works in place on the surface pixels, through
+# pygame.surfarray. Pixel-wise operations run over blocks of columns
+# with preallocated scratch buffers, so their memory use is bounded by
+# BLOCK pixels whatever the surface size
+
+BLOCK = 1 << 16
+
+
+#-----------------------------------------------------------------------
+def _blocks(pixels:numpy.ndarray):
+    width, height = pixels.shape[:2]
+    columns = BLOCK // max(1, height)
+    if columns:
+        for x in range(0, width, columns):
+            yield pixels[x:x + columns]
+    else:
+        for x in range(width):
+            for y in range(0, height, BLOCK):
+                yield pixels[x:x + 1, y:y + BLOCK]
+
+
+#-----------------------------------------------------------------------
+def _lookup(lut:numpy.ndarray, pixels:numpy.ndarray, scratch:numpy.ndarray) -> None:
+    # numpy.take into a strided view of the pixels would copy it whole
+    for block in _blocks(pixels):
+        out = scratch[:block.size].reshape(block.shape)
+        numpy.take(lut, block, out=out, mode='clip')
+        block[...] = out
+
+
+#-----------------------------------------------------------------------
+def _ramp(start, end, size:int) -> numpy.ndarray:
+    start = numpy.asarray(start, numpy.float32)
+    end = numpy.asarray(end, numpy.float32)
+    steps = numpy.arange(size, dtype=numpy.float32) / size
+    ramp = start + numpy.multiply.outer(steps, end - start)
+    return numpy.clip(ramp, 0, 0xff).astype(numpy.uint8)
+
+
+#-----------------------------------------------------------------------
+def gradient(surface:Surface, start:tuple, end:tuple, *, vertical:bool=False) -> None:
+    pixels = pygame.surfarray.pixels3d(surface)
+    width, height, _ = pixels.shape
+    if vertical:
+        pixels[...] = _ramp(start[:3], end[:3], height)[numpy.newaxis, :, :]
+    else:
+        pixels[...] = _ramp(start[:3], end[:3], width)[:, numpy.newaxis, :]
+
+
+#-----------------------------------------------------------------------
+def alpha_gradient(surface:Surface, start:int, end:int, *, vertical:bool=False) -> None:
+    alpha = pygame.surfarray.pixels_alpha(surface)
+    width, height = alpha.shape
+    if vertical:
+        alpha[...] = _ramp(start, end, height)[numpy.newaxis, :]
+    else:
+        alpha[...] = _ramp(start, end, width)[:, numpy.newaxis]
+
+
+#-----------------------------------------------------------------------
+def levels(*, gamma:float=1., contrast:float=1., brightness:float=0.) -> numpy.ndarray:
+    values = numpy.arange(0x100, dtype=numpy.float32) / 0xff
+    values **= 1 / gamma
+    values = (values - .5) * contrast + .5 + brightness
+    return numpy.clip(numpy.rint(values * 0xff), 0, 0xff).astype(numpy.uint8)
+
+
+#-----------------------------------------------------------------------
+def grade(surface:Surface, lut:numpy.ndarray=None, *, matrix=None, offset=None) -> None:
+    # lut: one 256-entry table for all channels, or one per channel (3×256)
+    # matrix/offset: colour matrix applied to each pixel after the tables;
+    # this one needs a float copy of the pixels
+    pixels = pygame.surfarray.pixels3d(surface)
+
+    if lut is not None:
+        lut = numpy.asarray(lut, numpy.uint8)
+        scratch = numpy.empty(BLOCK * 3, numpy.uint8)
+        if lut.ndim == 1:
+            _lookup(lut, pixels, scratch)
+        else:
+            for channel in range(3):
+                _lookup(lut[channel], pixels[..., channel], scratch)
+
+    if matrix is not None or offset is not None:
+        matrix = numpy.eye(3, dtype=numpy.float32) if matrix is None \
+            else numpy.asarray(matrix, numpy.float32).T
+        offset = numpy.zeros(3, numpy.float32) if offset is None \
+            else numpy.asarray(offset, numpy.float32)
+        colors = numpy.empty(BLOCK * 3, numpy.float32)
+        result = numpy.empty(BLOCK * 3, numpy.float32)
+        for block in _blocks(pixels):
+            shape = block.size // 3, 3
+            source = colors[:block.size].reshape(shape)
+            target = result[:block.size].reshape(shape)
+            source[...] = block.reshape(shape)
+            numpy.matmul(source, matrix, out=target)
+            target += offset
+            numpy.clip(target, 0, 0xff, out=target)
+            block[...] = target.reshape(block.shape)
+
+
+#-----------------------------------------------------------------------
+def fade(surface:Surface, factor:float, color:tuple=(0, 0, 0)) -> None:
+    # Blends every pixel towards color: factor 1 keeps the surface as is
+    values = numpy.arange(0x100, dtype=numpy.float32)
+    lut = numpy.empty((3, 0x100), numpy.uint8)
+    for channel in range(3):
+        lut[channel] = numpy.clip(numpy.rint(values * factor + color[channel] * (1 - factor)), 0, 0xff)
+    grade(surface, lut)
+
+
+#-----------------------------------------------------------------------
+def fade_alpha(surface:Surface, factor:float) -> None:
+    alpha = pygame.surfarray.pixels_alpha(surface)
+    lut = numpy.rint(numpy.arange(0x100, dtype=numpy.float32) * factor)
+    lut = numpy.clip(lut, 0, 0xff).astype(numpy.uint8)
+    _lookup(lut, alpha, numpy.empty(BLOCK, numpy.uint8))
+
+
+#-----------------------------------------------------------------------
+def remap(surface:Surface, palette:dict) -> None:
+    # Exact colour replacement; per-pixel alpha is preserved
+    if not palette:
+        return
+    pixels = pygame.surfarray.pixels2d(surface)
+    rmask, gmask, bmask, _ = surface.get_masks()
+    # 8-bit surfaces hold palette indexes
+    mask = (rmask | gmask | bmask) or 0xff
+    keep = numpy.array(~mask & ((1 << 8 * pixels.itemsize) - 1), pixels.dtype)
+    color_mask = numpy.array(mask, pixels.dtype)
+
+    sources = numpy.array([surface.map_rgb(source) & mask for source in palette], pixels.dtype)
+    targets = numpy.array([surface.map_rgb(target) & mask for target in palette.values()], pixels.dtype)
+    order = numpy.argsort(sources)
+    sources = sources[order]
+    targets = targets[order]
+
+    for block in _blocks(pixels):
+        colors = block & color_mask
+        index = numpy.searchsorted(sources, colors)
+        index.clip(0, len(sources) - 1, out=index)
+        match = sources[index] == colors
+        block[match] = targets[index[match]] | (block[match] & keep)
@@ -1,12 +1,15 @@
 import sys
-from inspect import isgeneratorfunction
+import time
+from heapq import heappop, heappush
+from inspect import iscoroutinefunction, isgeneratorfunction
+from itertools import count
 import traceback
 from abc import ABCMeta, abstractmethod
 import asyncio
 import pygame
 from pygame.locals import *
 
-__all__ = ['FrameManager']
+__all__ = ['FrameManager', 'Scene']
 
 EventLoop = asyncio.base_events.BaseEventLoop
 Event = pygame.event.Event
@@ -15,12 +18,84 @@ Surface = pygame.surface.Surface
 Clock = pygame.time.Clock
 
 
+#-----------------------------------------------------------------------
+class Scene:
+
+    manager = None
+    loaded = False
+
+
+    #---------------------------------------------------------------
+    # Override
+    #
+
+    def load(self) -> None:
+        pass
+
+
+    def unload(self) -> None:
+        pass
+
+
+    def draw(self) -> None:
+        self.screen.fill((0, 0, 0))
+
+
+    def handle_event(self, event:Event) -> None:
+        pass
+
+
+    def update(self, milliseconds:float) -> None:
+        pass
+
+
+    def suspend(self) -> None:
+        pass
+
+
+    def resume(self) -> None:
+        pass
+
+
+    #---------------------------------------------------------------
+    # API
+    #
+
+    @property
+    def screen(self) -> Surface:
+        return self.manager.screen
+
+
+#-----------------------------------------------------------------------
+class _Steps:
+
+    # Awaitable driving a generator: bare yields hand control back to
+    # the loop, `yield from future` waits for it
+
+    def __init__(self, generator):
+        self.generator = generator
+
+
+    def __await__(self):
+        return self.generator
+
+
+#-----------------------------------------------------------------------
+def _asynchronous(function) -> bool:
+    return iscoroutinefunction(function) or isgeneratorfunction(function)
+
+
 #-----------------------------------------------------------------------
 class FrameManager(metaclass=ABCMeta):
 
     DELAY = pow(2, -10)
     MSPF = 1000 / 60 # 60fps ~ 16.67ms / frame
+    WORK_BUDGET = 8. # ms / frame at most for scheduled jobs
     __screen = None
+    __scenes = ()
+    __loading = None
+    __pending = None
+    __jobs = None
 
 
     #---------------------------------------------------------------
@@ -119,6 +194,63 @@ class FrameManager(metaclass=ABCMeta):
         self.__screen = screen
 
 
+    @property
+    def scene(self) -> Scene:
+        return self.__scenes[-1] if self.__scenes else None
+
+
+    def preload(self, scene:Scene) -> Future:
+        if self.__loading is None:
+            self.__loading = {}
+        loading = self.__loading
+        future = loading.get(scene)
+
+        if future is None:
+            scene.manager = self
+            if iscoroutinefunction(scene.load):
+                future = asyncio.ensure_future(scene.load(), loop=self.loop)
+            elif isgeneratorfunction(scene.load):
+                # Generator loaders, like FrameManager.load, run as tasks
+                future = asyncio.ensure_future(_Steps(scene.load()), loop=self.loop)
+            else:
+                # Plain loaders run in a worker thread, off the frame loop
+                future = self.loop.run_in_executor(None, scene.load)
+            loading[scene] = future
+            future.add_done_callback(lambda future: self.__loaded(scene, future))
+
+        return future
+
+
+    def push_scene(self, scene:Scene) -> None:
+        self.__when_loaded(scene, self.__push)
+
+
+    def replace_scene(self, scene:Scene) -> None:
+        self.__when_loaded(scene, self.__replace)
+
+
+    def pop_scene(self) -> Scene:
+        if not self.__scenes:
+            raise IndexError('pop from empty scene stack')
+        scene = self.__remove()
+        if self.__scenes:
+            self.__scenes[-1].resume()
+        return scene
+
+
+    def schedule(self, job, priority:int=0) -> Future:
+        # job: generator run one step at a time in the time left by each
+        # frame; higher priorities first, round-robin among equals
+        if isgeneratorfunction(job):
+            job = job()
+        if self.__jobs is None:
+            self.__jobs = []
+            self.__sequence = count()
+        future = self.loop.create_future()
+        heappush(self.__jobs, (-priority, next(self.__sequence), job, future))
+        return future
+
+
     @classmethod
     def main(cls):
         self = cls()
@@ -130,13 +262,112 @@ class FrameManager(metaclass=ABCMeta):
     # Internals
     #
 
+    @property
+    def _target(self):
+        return self.scene or self
+
+
+    def __loaded(self, scene:Scene, future:Future) -> None:
+        self.__loading.pop(scene, None)
+        if not future.cancelled() and future.exception() is None:
+            scene.loaded = True
+
+
+    def __when_loaded(self, scene:Scene, transition) -> None:
+        # A scene still preloading keeps the current one running until
+        # it's ready; one never preloaded is loaded right away. Only the
+        # last transition requested while loading takes place
+        scene.manager = self
+        future = (self.__loading or {}).get(scene)
+        if future is None and not scene.loaded and _asynchronous(scene.load):
+            future = self.preload(scene)
+
+        if future is not None:
+            if self.__pending is None:
+                self.__pending = {}
+            pending = self.__pending
+
+            if scene not in pending:
+                def done(future:Future) -> None:
+                    transition = pending.pop(scene)
+                    if scene.loaded:
+                        transition(scene)
+                    elif not future.cancelled():
+                        error = future.exception()
+                        traceback.print_exception(type(error), error, error.__traceback__)
+                future.add_done_callback(done)
+
+            pending[scene] = transition
+
+        else:
+            if not scene.loaded:
+                scene.load()
+                scene.loaded = True
+            transition(scene)
+
+
+    def __push(self, scene:Scene) -> None:
+        scenes = self.__scenes
+        if scenes:
+            scenes[-1].suspend()
+        else:
+            scenes = self.__scenes = []
+        scenes.append(scene)
+        scene.resume()
+
+
+    def __replace(self, scene:Scene) -> None:
+        if self.__scenes:
+            self.__remove()
+        self.__push(scene)
+
+
+    def __remove(self) -> Scene:
+        scene = self.__scenes.pop()
+        scene.suspend()
+        scene.unload()
+        scene.loaded = False
+        return scene
+
+
+    def _run_jobs(self, budget:float) -> float:
+        jobs = self.__jobs
+        if not jobs:
+            return 0.
+
+        start = time.perf_counter()
+        deadline = start + budget / 1000
+        while jobs and time.perf_counter() < deadline:
+            # Popped before stepping: the job may schedule others, which
+            # could take the top of the heap meanwhile
+            priority, _, job, future = heappop(jobs)
+            if future.done():
+                job.close()
+                continue
+
+            try:
+                next(job)
+            except StopIteration as stop:
+                if not future.done():
+                    future.set_result(stop.value)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                heappush(jobs, (priority, next(self.__sequence), job, future))
+
+        return (time.perf_counter() - start) * 1000
+
+
     def _event_callback(self) -> None:
         for event in pygame.event.get():
             if event.type == QUIT:
                 self.quit()
             else:
                 try:
-                    self.handle_event(event)
+                    self._target.handle_event(event)
                 except (SystemExit, KeyboardInterrupt):
                     raise
                 except:
@@ -146,7 +377,7 @@ class FrameManager(metaclass=ABCMeta):
 
     def _update_callback(self, clock:Clock) -> None:
         try:
-            self.update(milliseconds=clock.tick())
+            self._target.update(milliseconds=clock.tick())
 
         except:
             traceback.print_exc()
@@ -158,7 +389,7 @@ class FrameManager(metaclass=ABCMeta):
     def _draw_callback(self, clock:Clock) -> None:
         clock.tick()
         try:
-            self.draw()
+            self._target.draw()
             if self.screen.get_flags() & DOUBLEBUF:
                 pygame.display.flip()
             else:
@@ -170,4 +401,11 @@ class FrameManager(metaclass=ABCMeta):
         else:
             delay = self.MSPF - clock.tick()
             delay = 0 if delay <= 0 else delay
+            if delay:
+                try:
+                    delay = max(0, delay - self._run_jobs(min(delay, self.WORK_BUDGET)))
+                except (SystemExit, KeyboardInterrupt):
+                    raise
+                except:
+                    traceback.print_exc()
             self.loop.call_later(delay / 1000, self._draw_callback, clock)
@@ -1,6 +1,8 @@
+from numpy import ascontiguousarray, float32, float64, floating, issubdtype
 from pygame.surface import Surface
 from OpenGL.GL import *
 from OpenGL.GLU import *
+from .dtype import gl_array
 
 
 #-----------------------------------------------------------------------
@@ -23,3 +25,25 @@ def resize(screen:Surface, perspective:float=60.) -> None:
     gluPerspective(perspective, float(width) / height, 1., 10000.)
     glMatrixMode(GL_MODELVIEW)
     glLoadIdentity()
+
+
+#-----------------------------------------------------------------------
+def load_matrix(matrix) -> None:
+    # Matrix rows already follow OpenGL memory order (translation in the
+    # last row), so the contiguous buffer is handed over as is
+    dtype = getattr(matrix, 'dtype', None)
+    data = gl_array(matrix, dtype if dtype in (float32, float64) else None)
+    if data.dtype == float32:
+        glLoadMatrixf(data)
+    else:
+        glLoadMatrixd(data)
+
+
+#-----------------------------------------------------------------------
+def buffer_data(target:int, data, usage:int=GL_STATIC_DRAW) -> None:
+    # Floating point data goes in the library dtype; integers, such as
+    # element indexes, are uploaded in their own type
+    data = ascontiguousarray(data)
+    if issubdtype(data.dtype, floating):
+        data = gl_array(data)
+    glBufferData(target, data.nbytes, data, usage)
@@ -1,25 +1,74 @@
 import math
-from numpy import matrix
+from functools import reduce
+import numpy
+from numpy import array, matrix, ndarray
+from .dtype import get_dtype, gl_array
 from .vector import Vector
 
-__all__ = ['Matrix']
+__all__ = ['Matrix', 'Matrix4']
+
+IDENTITY = [
+    [1., 0., 0., 0.],
+    [0., 1., 0., 0.],
+    [0., 0., 1., 0.],
+    [0., 0., 0., 1.],
+]
 
 
 #-----------------------------------------------------------------------
-class Matrix(matrix):
+class MatrixFactory:
+
+    @classmethod
+    def make_translation(cls, vector:Vector) -> 'MatrixFactory':
+        return cls([
+            [1., 0., 0., 0.],
+            [0., 1., 0., 0.],
+            [0., 0., 1., 0.],
+            [vector.x, vector.y, vector.z, 1.],
+        ])
+
+
+    @classmethod
+    def make_xyz_rotate(cls, angle_x:float=0., angle_y:float=0., angle_z:float=0.) -> 'MatrixFactory':
+        cx = math.cos(math.radians(angle_x))
+        sx = math.sin(math.radians(angle_x))
+        cy = math.cos(math.radians(angle_y))
+        sy = math.sin(math.radians(angle_y))
+        cz = math.cos(math.radians(angle_z))
+        sz = math.sin(math.radians(angle_z))
+
+        sxsy = sx * sy
+        cxsy = cx * sy
+
+        return cls([
+            [cy * cz,  sxsy * cz + cx * sz,  -cxsy * cz + sx * sz, 0.],
+            [-cy * sz, -sxsy * sz + cx * cz, cxsy * sz + sx * cz, 0.],
+            [sy, -sx * cy, cx*cy, 0.],
+            [0., 0., 0., 1.],
+        ])
+
+
+#-----------------------------------------------------------------------
+class Matrix(MatrixFactory, matrix):
 
     def __new__(cls, data:(list, str)=None, dtype:type=None, copy:bool=True):
         if not data:
             # Default: identity
-            data = [
-                [1., 0., 0., 0.],
-                [0., 1., 0., 0.],
-                [0., 0., 1., 0.],
-                [0., 0., 0., 1.],
-            ]
+            data = IDENTITY
+        dtype = dtype or get_dtype()
         return super(Matrix, cls).__new__(cls, data, dtype, copy)
 
 
+    @property
+    def gl_data(self) -> ndarray:
+        return gl_array(self)
+
+
+    @classmethod
+    def batch(cls, matrices) -> ndarray:
+        return gl_array(matrices)
+
+
     def transform(self, vector:Vector) -> Vector:
         if len(vector) < 4:
             w = 1
@@ -32,31 +81,112 @@ class Matrix(matrix):
         ])
 
 
+#-----------------------------------------------------------------------
+class Matrix4(MatrixFactory, ndarray):
+
+    # 4×4 affine transform on a plain ndarray, in the row-vector
+    # convention of the make_* constructors: v' = v · M, translation in
+    # the last row, which is also the OpenGL memory layout
+
+    def __new__(cls, data=None, dtype:type=None):
+        self = array(IDENTITY if data is None else data, dtype=dtype or get_dtype()).view(cls)
+        self._check()
+        return self
+
+
+    # Rows, columns, reductions and the like are plain arrays: only 4×4
+    # results stay Matrix4. Views reshaped by methods such as ravel()
+    # can't be retyped, so the 4×4 methods check their shape too
+
+    def __getitem__(self, index):
+        result = super().__getitem__(index)
+        if isinstance(result, Matrix4) and result.shape != (4, 4):
+            return result.view(ndarray)
+        return result
+
+
+    def __array_wrap__(self, result, *args, **kwargs):
+        if result.shape == (4, 4):
+            return super().__array_wrap__(result, *args, **kwargs)
+        return self.view(ndarray).__array_wrap__(result, *args, **kwargs)
+
+
+    def _check(self) -> None:
+        if self.shape != (4, 4):
+            raise ValueError('Matrix4 must be 4×4, got {}'.format(self.shape))
+
+
+    @property
+    def gl_data(self) -> ndarray:
+        return gl_array(self)
+
+
     @classmethod
-    def make_translation(cls, vector:Vector) -> matrix:
-        return cls([
-            [1., 0., 0., 0.],
-            [0., 1., 0., 0.],
-            [0., 0., 1., 0.],
-            [vector.x, vector.y, vector.z, 1.],
-        ])
+    def batch(cls, matrices) -> ndarray:
+        return gl_array(matrices)
 
 
     @classmethod
-    def make_xyz_rotate(cls, angle_x:float=0., angle_y:float=0., angle_z:float=0.) -> matrix:
-        cx = cos(math.radians(angle_x))
-        sx = sin(math.radians(angle_x))
-        cy = cos(math.radians(angle_y))
-        sy = sin(math.radians(angle_y))
-        cz = cos(math.radians(angle_z))
-        sz = sin(math.radians(angle_z))
+    def chain(cls, *matrices) -> 'Matrix4':
+        # Applies the first matrix first; one product for the whole chain
+        # instead of transforming vectors through each step
+        if not matrices:
+            return cls()
+        if len(matrices) <= 8:
+            return reduce(numpy.matmul, matrices).view(cls)
 
-        sxsy = sx * sy
-        cxcy = cx * cy
+        # Long chains: pairwise batched products, log2(n) numpy calls
+        stack = numpy.array(matrices)
+        while len(stack) > 1:
+            size = len(stack)
+            product = stack[0:size - 1:2] @ stack[1:size:2]
+            stack = numpy.concatenate([product, stack[size - 1:]]) if size % 2 else product
+        return stack[0].view(cls)
 
-        return cls([
-            [cy * cz,  sxsy * cz + cx * sz,  -cxsy * cz + sx * sz, 0.],
-            [-cy * sz, -sxsy * sz + cx * cz, cxsy * sz + sx * cz, 0.],
-            [sy, -sx * cy, cx*cy, 0.],
-            [0., 0., 0., 1.],
-        ])
+
+    def then(self, other:'Matrix4') -> 'Matrix4':
+        self._check()
+        return numpy.matmul(self, other)
+
+
+    def inverse(self, rigid:bool=False) -> 'Matrix4':
+        # Affine inverse: [R 0; t 1]⁻¹ = [R⁻¹ 0; -t·R⁻¹ 1]; for rigid
+        # transforms (rotation + translation) R⁻¹ is just Rᵀ
+        # 3×3 on Python floats: cheaper than numpy.linalg at this size
+        self._check()
+        (a, b, c, _), (d, e, f, _), (g, h, i, _), (x, y, z, _) = self.tolist()
+
+        if rigid:
+            a, b, c, d, e, f, g, h, i = a, d, g, b, e, h, c, f, i
+
+        else:
+            A, B, C = e * i - f * h, f * g - d * i, d * h - e * g
+            det = a * A + b * B + c * C
+            if not det:
+                raise numpy.linalg.LinAlgError('singular matrix')
+            a, b, c, d, e, f, g, h, i = (
+                A / det, (c * h - b * i) / det, (b * f - c * e) / det,
+                B / det, (a * i - c * g) / det, (c * d - a * f) / det,
+                C / det, (b * g - a * h) / det, (a * e - b * d) / det,
+            )
+
+        return Matrix4([
+            [a, b, c, 0.],
+            [d, e, f, 0.],
+            [g, h, i, 0.],
+            [-(x * a + y * d + z * g), -(x * b + y * e + z * h), -(x * c + y * f + z * i), 1.],
+        ], self.dtype)
+
+
+    def transform(self, vector:ndarray) -> ndarray:
+        # A single Vector or a batch of them, one per row; w defaults to 1
+        self._check()
+        data = self.view(ndarray)
+        points = numpy.asarray(vector)
+        if points.shape[-1] < 4:
+            result = points[..., :3] @ data[:3, :3] + data[3, :3]
+        else:
+            result = points[..., :4] @ data[:, :3]
+        if result.ndim == 1:
+            return result.view(Vector)
+        return result
@@ -0,0 +1,121 @@
+import numpy
+import pygame
+from .dtype import get_dtype
+
+__all__ = ['ParticleEmitter']
+
+Surface = pygame.surface.Surface
+
+
+#-----------------------------------------------------------------------
+class ParticleEmitter:
+
+    def __init__(self, capacity:int, *, gravity:tuple=(0., 0.),
+                 image:Surface=None, seed:int=None):
+        dtype = get_dtype()
+        self.capacity = capacity
+        self.image = image
+        self.gravity = numpy.array(gravity, dtype)
+        self.random = numpy.random.default_rng(seed)
+
+        # Particle storage is allocated once: dead slots are recycled by
+        # emit() and never freed
+        self.positions = numpy.zeros((capacity, 2), dtype)
+        self.velocities = numpy.zeros((capacity, 2), dtype)
+        self.lifetimes = numpy.zeros(capacity, dtype)
+        self.colors = numpy.zeros((capacity, 3), numpy.uint8)
+        self.alive = numpy.zeros(capacity, bool)
+        self.__step = numpy.zeros((capacity, 2), dtype)
+
+
+    def __len__(self) -> int:
+        return int(numpy.count_nonzero(self.alive))
+
+
+    def emit(self, count:int, position:tuple, *, velocity:tuple=(0., 0.),
+             spread:float=0., lifetime:float=1000., color:tuple=(0xff, 0xff, 0xff)) -> int:
+        slots = numpy.flatnonzero(~self.alive)[:count]
+        count = len(slots)
+        if count:
+            self.positions[slots] = position
+            self.velocities[slots] = velocity
+            if spread:
+                self.velocities[slots] += self.random.uniform(-spread, spread, (count, 2))
+            self.lifetimes[slots] = lifetime
+            self.colors[slots] = color
+            self.alive[slots] = True
+        return count
+
+
+    def clear(self) -> None:
+        self.alive[:] = False
+        self.lifetimes[:] = 0
+
+
+    def update(self, milliseconds:float) -> None:
+        # Dead particles are integrated too: masking would cost more than
+        # the arithmetic it saves
+        seconds = milliseconds / 1000
+        step = self.__step
+        self.velocities += self.gravity * seconds
+        numpy.multiply(self.velocities, seconds, out=step)
+        self.positions += step
+        self.lifetimes -= milliseconds
+        numpy.greater(self.lifetimes, 0, out=self.alive)
+
+
+    def draw(self, surface:Surface, offset:tuple=(0, 0)) -> None:
+        if self.image is None:
+            self.__draw_pixels(surface, offset)
+        else:
+            self.__draw_image(surface, offset)
+
+
+    def __draw_pixels(self, surface:Surface, offset:tuple) -> None:
+        # Everything stays in 1-D arrays: gathering rows of 2-D arrays is
+        # several times slower for large particle counts. Positions are
+        # floored, not truncated, so -0.5 lands outside column 0
+        width, height = surface.get_size()
+        x = numpy.floor(self.positions[:, 0]).astype(numpy.intp)
+        y = numpy.floor(self.positions[:, 1]).astype(numpy.intp)
+        x += offset[0]
+        y += offset[1]
+        visible = self.alive & (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        x = x[visible]
+        y = y[visible]
+        bytesize = surface.get_bytesize()
+
+        if bytesize == 4:
+            colors = self.colors
+            rshift, gshift, bshift, _ = surface.get_shifts()
+            mapped = colors[:, 0].astype(numpy.uint32) << rshift
+            mapped |= colors[:, 1].astype(numpy.uint32) << gshift
+            mapped |= colors[:, 2].astype(numpy.uint32) << bshift
+            mapped |= surface.get_masks()[3]
+            mapped = mapped[visible]
+
+        elif bytesize == 3:
+            # No 2-D reference array for 24-bit surfaces
+            pixels = pygame.surfarray.pixels3d(surface)
+            try:
+                pixels[x, y] = self.colors[visible]
+            finally:
+                del pixels
+            return
+
+        else:
+            # 8-bit (palette) and 16-bit surfaces
+            mapped = pygame.surfarray.map_array(surface, self.colors[visible])
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        try:
+            pixels[x, y] = mapped
+        finally:
+            del pixels
+
+
+    def __draw_image(self, surface:Surface, offset:tuple) -> None:
+        points = numpy.floor(self.positions[self.alive]).astype(int)
+        points += offset
+        image = self.image
+        surface.blits([(image, point) for point in points.tolist()], doreturn=False)
@@ -0,0 +1,170 @@
+from abc import ABCMeta, abstractmethod
+import numpy
+from .dtype import get_dtype
+
+__all__ = ['Bodies', 'Integrator', 'SemiImplicitEuler', 'Verlet', 'sweep_and_prune']
+
+
+#-----------------------------------------------------------------------
+class Bodies:
+
+    # One row per body; forces accumulate during a frame and are cleared
+    # by the integrator after each update
+
+    def __init__(self, count:int, dimensions:int=2):
+        dtype = get_dtype()
+        self.positions = numpy.zeros((count, dimensions), dtype)
+        self.velocities = numpy.zeros((count, dimensions), dtype)
+        self.forces = numpy.zeros((count, dimensions), dtype)
+        self.inverse_masses = numpy.ones(count, dtype)
+        self.radii = numpy.ones(count, dtype)
+
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+    def collisions(self, axis:int=0) -> numpy.ndarray:
+        return sweep_and_prune(self.positions, self.radii, axis)
+
+
+#-----------------------------------------------------------------------
+class Integrator(metaclass=ABCMeta):
+
+    def __init__(self, bodies:Bodies, *, substeps:int=1, gravity:tuple=None):
+        self.bodies = bodies
+        self.substeps = substeps
+        dimensions = bodies.positions.shape[1]
+        self.gravity = numpy.zeros(dimensions, bodies.positions.dtype)
+        if gravity is not None:
+            self.gravity[:] = gravity
+        self._acceleration = numpy.empty_like(bodies.positions)
+        self._scratch = numpy.empty_like(bodies.positions)
+
+
+    @abstractmethod
+    def step(self, seconds:float) -> None:
+        pass
+
+
+    def update(self, milliseconds:float) -> None:
+        bodies = self.bodies
+        # Forces are constant over the frame: acceleration computed once
+        acceleration = self._acceleration
+        numpy.multiply(bodies.forces, bodies.inverse_masses[:, numpy.newaxis], out=acceleration)
+        acceleration += self.gravity
+
+        seconds = milliseconds / 1000 / self.substeps
+        for _ in range(self.substeps):
+            self.step(seconds)
+        bodies.forces[...] = 0
+
+
+#-----------------------------------------------------------------------
+class SemiImplicitEuler(Integrator):
+
+    def step(self, seconds:float) -> None:
+        bodies = self.bodies
+        scratch = self._scratch
+        numpy.multiply(self._acceleration, seconds, out=scratch)
+        bodies.velocities += scratch
+        numpy.multiply(bodies.velocities, seconds, out=scratch)
+        bodies.positions += scratch
+
+
+#-----------------------------------------------------------------------
+class Verlet(Integrator):
+
+    # Position (Störmer) Verlet; velocities are derived from positions
+    # after each step. The previous positions are rebuilt from the
+    # velocities on every update, so frame times may vary and velocities
+    # set by hand between updates are honoured
+
+    def update(self, milliseconds:float) -> None:
+        seconds = milliseconds / 1000 / self.substeps
+        bodies = self.bodies
+        self.__previous = bodies.positions - bodies.velocities * seconds
+        super().update(milliseconds)
+
+
+    def step(self, seconds:float) -> None:
+        bodies = self.bodies
+        positions = bodies.positions
+        previous = self.__previous
+        scratch = self._scratch
+
+        # next = 2·position − previous + acceleration·dt²
+        numpy.multiply(self._acceleration, seconds * seconds, out=scratch)
+        scratch += positions
+        scratch += positions
+        scratch -= previous
+        previous[...] = positions
+        positions[...] = scratch
+
+        numpy.subtract(positions, previous, out=bodies.velocities)
+        bodies.velocities /= seconds
+
+
+#-----------------------------------------------------------------------
+def sweep_and_prune(positions:numpy.ndarray, radii:numpy.ndarray, axis:int=0) -> numpy.ndarray:
+    # Returns the (i, j) pairs, i < j, of overlapping circles/spheres
+    count = len(positions)
+    if count < 2:
+        return numpy.empty((0, 2), numpy.intp)
+
+    # Broad phase: intervals on one axis sorted by their lower bound;
+    # each body is a candidate against the next `reach` ones, which
+    # start before it ends
+    lower = positions[:, axis] - radii
+    order = numpy.argsort(lower, kind='stable')
+    lower = lower[order]
+    radii = radii[order]
+    columns = numpy.ascontiguousarray(positions[order].T)
+    ends = numpy.searchsorted(lower, lower + 2 * radii, side='right')
+    reach = ends - numpy.arange(1, count + 1)
+
+    # Narrow phase, offset by offset: body i against body i + offset for
+    # every i at once, on contiguous slices, while enough bodies still
+    # have candidates that far
+    firsts = []
+    offset = 1
+    while offset < count and 4 * numpy.count_nonzero(reach >= offset) >= count:
+        size = count - offset
+        first = numpy.flatnonzero(
+            _overlapping(columns, radii, slice(0, size), slice(offset, count))
+            & (reach[:size] >= offset)
+        )
+        firsts.append((first, first + offset))
+        offset += 1
+
+    # The few bodies left, candidate pairs gathered explicitly
+    active = numpy.flatnonzero(reach >= offset)
+    if len(active):
+        counts = reach[active] - offset + 1
+        total = int(counts.sum())
+        first = numpy.repeat(active, counts)
+        second = numpy.arange(total) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        second += first + offset
+        hit = _overlapping(columns, radii, first, second)
+        firsts.append((first[hit], second[hit]))
+
+    if not firsts:
+        return numpy.empty((0, 2), numpy.intp)
+    pairs = numpy.stack([
+        order[numpy.concatenate([first for first, _ in firsts])],
+        order[numpy.concatenate([second for _, second in firsts])],
+    ], axis=1)
+    pairs.sort(axis=1)
+    return pairs
+
+
+#-----------------------------------------------------------------------
+def _overlapping(columns:numpy.ndarray, radii:numpy.ndarray, first, second) -> numpy.ndarray:
+    reach = radii[first] + radii[second]
+    reach *= reach
+    distance = numpy.zeros(len(reach), columns.dtype)
+    for column in columns:
+        delta = column[first] - column[second]
+        delta *= delta
+        distance += delta
+    return distance < reach
@@ -0,0 +1,103 @@
+import os
+import tempfile
+from os import path
+from unittest import TestCase
+import pygame
+from kundalini.assetpack import AssetPack, build
+
+__all__ = ['TestAssetPack']
+
+
+#-----------------------------------------------------------------------
+class TestAssetPack(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.assets = path.join(self.tmp.name, 'assets')
+        os.makedirs(path.join(self.assets, 'sprites'))
+        with open(path.join(self.assets, 'hello.txt'), 'wb') as fd:
+            fd.write(b'hello world')
+        image = pygame.Surface((3, 2), 0, 32)
+        image.fill((0xff, 0, 0))
+        pygame.image.save(image, path.join(self.assets, 'sprites', 'red.bmp'))
+        self.pack = path.join(self.tmp.name, 'assets.kpak')
+
+
+    def test_build(self):
+        index = build(self.pack, [self.assets])
+        self.assertEqual(sorted(index), ['hello.txt', 'sprites/red.bmp'])
+        for offset, _ in index.values():
+            self.assertEqual(offset % 16, 0)
+
+
+    def test_read(self):
+        build(self.pack, [self.assets])
+        with AssetPack(self.pack) as pack:
+            self.assertEqual(len(pack), 2)
+            self.assertIn('hello.txt', pack)
+            view = pack['hello.txt']
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual(bytes(view), b'hello world')
+            self.assertEqual(pack.open('hello.txt').read(5), b'hello')
+            view.release()
+
+
+    def test_load_image(self):
+        build(self.pack, [self.assets])
+        with AssetPack(self.pack) as pack:
+            image = pack.load_image('sprites/red.bmp')
+        self.assertEqual(image.get_size(), (3, 2))
+        self.assertEqual(tuple(image.get_at((1, 1)))[:3], (0xff, 0, 0))
+
+
+    def test_single_file(self):
+        index = build(self.pack, [path.join(self.assets, 'hello.txt')])
+        self.assertEqual(list(index), ['hello.txt'])
+
+
+    def test_duplicated(self):
+        hello = path.join(self.assets, 'hello.txt')
+        with self.assertRaises(ValueError):
+            build(self.pack, [hello, hello])
+        self.assertEqual(os.listdir(self.tmp.name), ['assets'])
+
+
+    def test_failed_build_keeps_pack(self):
+        build(self.pack, [self.assets])
+        with self.assertRaises(OSError):
+            build(self.pack, [self.assets, path.join(self.tmp.name, 'missing.txt')])
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['assets', 'assets.kpak'])
+        with AssetPack(self.pack) as pack:
+            self.assertEqual(len(pack), 2)
+
+
+    def test_close_with_live_view(self):
+        build(self.pack, [self.assets])
+        pack = AssetPack(self.pack)
+        view = pack['hello.txt']
+        with self.assertRaises(BufferError):
+            pack.close()
+        self.assertEqual(bytes(pack['hello.txt']), b'hello world')
+        self.assertEqual(bytes(view), b'hello world')
+        view.release()
+        pack.close()
+        pack.close()
+
+
+    def test_not_a_pack(self):
+        with open(self.pack, 'wb') as fd:
+            fd.write(b'\0' * 64)
+        with self.assertRaises(ValueError):
+            AssetPack(self.pack)
+
+
+    def test_truncated(self):
+        build(self.pack, [self.assets])
+        with open(self.pack, 'rb') as fd:
+            data = fd.read()
+        for size in 4, len(data) - 1:
+            with open(self.pack, 'wb') as fd:
+                fd.write(data[:size])
+            with self.assertRaises(ValueError):
+                AssetPack(self.pack)
@@ -0,0 +1,111 @@
+import os
+import tempfile
+from os import path
+from unittest import TestCase
+from unittest.mock import patch
+import pygame
+from kundalini.atlas import Atlas
+
+__all__ = ['TestAtlas']
+
+
+#-----------------------------------------------------------------------
+class TestAtlas(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.sources = {}
+        for name, size, color in [
+            ('red', (4, 3), (0xff, 0, 0)),
+            ('green', (2, 5), (0, 0xff, 0)),
+            ('blue', (6, 2), (0, 0, 0xff)),
+        ]:
+            image = pygame.Surface(size, 0, 32)
+            image.fill(color)
+            filename = path.join(self.tmp.name, name + '.png')
+            pygame.image.save(image, filename)
+            self.sources[name] = filename
+        self.cache = path.join(self.tmp.name, 'cache')
+
+
+    def test_build(self):
+        atlas = Atlas.build(self.sources, size=(16, 16))
+        self.assertEqual(len(atlas.pages), 1)
+        self.assertEqual(sorted(atlas), ['blue', 'green', 'red'])
+        self.assertEqual(atlas['red'].size, (4, 3))
+        self.assertEqual(tuple(atlas['green'].subsurface().get_at((1, 4)))[:3], (0, 0xff, 0))
+
+
+    def test_no_overlap(self):
+        atlas = Atlas.build(self.sources, size=(16, 16))
+        rects = [region.rect for region in atlas.regions.values()]
+        for i, rect in enumerate(rects):
+            self.assertEqual(rect.collidelist(rects[i + 1:]), -1)
+
+
+    def test_blit(self):
+        atlas = Atlas.build(self.sources, size=(16, 16))
+        target = pygame.Surface((8, 8), 0, 32)
+        atlas.blit(target, 'blue', (1, 1))
+        self.assertEqual(tuple(target.get_at((6, 2)))[:3], (0, 0, 0xff))
+        self.assertEqual(tuple(target.get_at((1, 3)))[:3], (0, 0, 0))
+
+
+    def test_pages(self):
+        atlas = Atlas.build(self.sources, size=(6, 6), padding=0)
+        self.assertGreater(len(atlas.pages), 1)
+        self.assertEqual(len(atlas), 3)
+
+
+    def test_too_large(self):
+        with self.assertRaises(ValueError):
+            Atlas.build(self.sources, size=(4, 4))
+
+
+    def test_cache(self):
+        atlas = Atlas.build(self.sources, size=(16, 16), cache_dir=self.cache)
+        self.assertEqual(len(os.listdir(self.cache)), 2)
+
+        with patch('kundalini.atlas._pack') as pack:
+            cached = Atlas.build(self.sources, size=(16, 16), cache_dir=self.cache)
+            self.assertFalse(pack.called)
+        self.assertEqual(
+            {name: tuple(region.rect) for name, region in cached.regions.items()},
+            {name: tuple(region.rect) for name, region in atlas.regions.items()},
+        )
+        self.assertEqual(tuple(cached['red'].subsurface().get_at((0, 0)))[:3], (0xff, 0, 0))
+
+
+    def test_cache_invalidated(self):
+        Atlas.build(self.sources, size=(16, 16), cache_dir=self.cache)
+        image = pygame.Surface((3, 3), 0, 32)
+        pygame.image.save(image, self.sources['red'])
+        atlas = Atlas.build(self.sources, size=(16, 16), cache_dir=self.cache)
+        self.assertEqual(atlas['red'].size, (3, 3))
+        self.assertEqual(len(os.listdir(self.cache)), 4)
+
+
+    def test_cache_broken(self):
+        Atlas.build(self.sources, size=(16, 16), cache_dir=self.cache)
+        files = sorted(os.listdir(self.cache))
+        layout, = [name for name in files if name.endswith('.json')]
+        page, = [name for name in files if name.endswith('.png')]
+        with open(path.join(self.cache, layout)) as fd:
+            content = fd.read()
+
+        for broken in 'layout', 'page':
+            if broken == 'layout':
+                with open(path.join(self.cache, layout), 'w') as fd:
+                    fd.write(content[:len(content) // 2])
+            else:
+                os.remove(path.join(self.cache, page))
+            atlas = Atlas.build(self.sources, size=(16, 16), cache_dir=self.cache)
+            self.assertEqual(atlas['red'].size, (4, 3))
+            self.assertEqual(sorted(os.listdir(self.cache)), files)
+
+
+    def test_bytes_sources(self):
+        with open(self.sources['red'], 'rb') as fd:
+            atlas = Atlas.build({'red': fd.read()}, size=(16, 16))
+        self.assertEqual(atlas['red'].size, (4, 3))
@@ -0,0 +1,80 @@
+from unittest import TestCase
+import numpy
+from kundalini import Vector, get_dtype, set_dtype
+from kundalini.matrix import Matrix
+from kundalini.dtype import gl_array
+
+__all__ = ['TestDtype']
+
+
+#-----------------------------------------------------------------------
+class TestDtype(TestCase):
+
+    def setUp(self):
+        self.dtype = get_dtype()
+
+
+    def tearDown(self):
+        set_dtype(self.dtype)
+
+
+    def test_default(self):
+        self.assertEqual(get_dtype(), numpy.float64)
+        self.assertEqual(Vector([1, 2, 3]).dtype, numpy.float64)
+        self.assertEqual(Matrix().dtype, numpy.float64)
+
+
+    def test_float32(self):
+        set_dtype(numpy.float32)
+        self.assertEqual(Vector([1, 2, 3]).dtype, numpy.float32)
+        self.assertEqual(Matrix().dtype, numpy.float32)
+        self.assertEqual((Vector([1, 2]) * 2).dtype, numpy.float32)
+
+
+    def test_float32_by_name(self):
+        set_dtype('float32')
+        self.assertEqual(get_dtype(), numpy.float32)
+
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            set_dtype(int)
+        self.assertEqual(get_dtype(), self.dtype)
+
+
+    def test_vector_gl_data(self):
+        set_dtype(numpy.float32)
+        vector = Vector([3, 4, 5])
+        data = vector.gl_data
+        self.assertTrue(data.flags['C_CONTIGUOUS'])
+        self.assertTrue(numpy.shares_memory(data, vector))
+
+
+    def test_matrix_gl_data(self):
+        set_dtype(numpy.float32)
+        m = Matrix.make_translation(Vector([1, 2, 3]))
+        data = m.gl_data
+        self.assertIs(type(data), numpy.ndarray)
+        self.assertTrue(data.flags['C_CONTIGUOUS'])
+        self.assertTrue(numpy.shares_memory(data, m))
+        self.assertEqual(list(data.ravel()[12:15]), [1, 2, 3])
+
+
+    def test_vector_batch(self):
+        set_dtype(numpy.float32)
+        batch = Vector.batch([Vector([1, 2, 3]), Vector([4, 5, 6])])
+        self.assertEqual(batch.shape, (2, 3))
+        self.assertEqual(batch.dtype, numpy.float32)
+        self.assertTrue(batch.flags['C_CONTIGUOUS'])
+
+
+    def test_matrix_batch(self):
+        batch = Matrix.batch([Matrix(), Matrix()])
+        self.assertEqual(batch.shape, (2, 4, 4))
+        self.assertTrue(batch.flags['C_CONTIGUOUS'])
+
+
+    def test_gl_array_converts(self):
+        data = gl_array(numpy.arange(8.)[::2], numpy.float32)
+        self.assertTrue(data.flags['C_CONTIGUOUS'])
+        self.assertEqual(data.dtype, numpy.float32)
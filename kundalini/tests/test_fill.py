@@ -0,0 +1,128 @@
+from unittest import TestCase
+from unittest.mock import patch
+import numpy
+import pygame
+from kundalini import fill
+
+__all__ = ['TestFill']
+
+
+#-----------------------------------------------------------------------
+class TestFill(TestCase):
+
+    def color(self, surface, position) -> tuple:
+        return tuple(surface.get_at(position))
+
+
+    def test_gradient(self):
+        surface = pygame.Surface((4, 2), 0, 32)
+        fill.gradient(surface, (0, 0, 0), (0xff, 0x80, 0))
+        self.assertEqual(self.color(surface, (0, 1))[:3], (0, 0, 0))
+        self.assertEqual(self.color(surface, (2, 0))[:3], (0x7f, 0x40, 0))
+        self.assertEqual(self.color(surface, (2, 0)), self.color(surface, (2, 1)))
+
+
+    def test_gradient_vertical(self):
+        surface = pygame.Surface((2, 4), 0, 24)
+        fill.gradient(surface, (0, 0, 0), (0, 0, 0xff), vertical=True)
+        self.assertEqual(self.color(surface, (1, 2))[:3], (0, 0, 0x7f))
+        self.assertEqual(self.color(surface, (0, 0))[:3], (0, 0, 0))
+
+
+    def test_gradient_subsurface(self):
+        surface = pygame.Surface((4, 4), 0, 32)
+        fill.gradient(surface.subsurface((2, 0, 2, 4)), (0xff, 0, 0), (0xff, 0, 0))
+        self.assertEqual(self.color(surface, (3, 3))[:3], (0xff, 0, 0))
+        self.assertEqual(self.color(surface, (1, 3))[:3], (0, 0, 0))
+
+
+    def test_alpha_gradient(self):
+        surface = pygame.Surface((4, 1), pygame.SRCALPHA, 32)
+        surface.fill((0xff, 0xff, 0xff, 0xff))
+        fill.alpha_gradient(surface, 0xff, 0)
+        self.assertEqual(self.color(surface, (0, 0)), (0xff, 0xff, 0xff, 0xff))
+        self.assertEqual(self.color(surface, (2, 0))[3], 0x7f)
+
+
+    def test_fade(self):
+        surface = pygame.Surface((2, 2), 0, 32)
+        surface.fill((200, 100, 0))
+        fill.fade(surface, .5)
+        self.assertEqual(self.color(surface, (1, 1))[:3], (100, 50, 0))
+        fill.fade(surface, .5, (0xff, 0xff, 0xff))
+        self.assertEqual(self.color(surface, (0, 0))[:3], (178, 152, 128))
+
+
+    def test_fade_out_of_range(self):
+        surface = pygame.Surface((2, 2), pygame.SRCALPHA, 32)
+        surface.fill((200, 100, 0, 200))
+        fill.fade(surface, 2.)
+        self.assertEqual(self.color(surface, (0, 0))[:3], (0xff, 200, 0))
+        fill.fade(surface, -1., (0xff, 0xff, 0xff))
+        self.assertEqual(self.color(surface, (0, 0))[:3], (0xff, 0xff, 0xff))
+        fill.fade_alpha(surface, 2.)
+        self.assertEqual(self.color(surface, (0, 0))[3], 0xff)
+        fill.fade_alpha(surface, -1.)
+        self.assertEqual(self.color(surface, (0, 0))[3], 0)
+
+
+    def test_blocks(self):
+        for block in 3, 16:
+            surface = pygame.Surface((5, 7), 0, 32)
+            surface.fill((10, 20, 30))
+            surface.set_at((4, 6), (1, 2, 3))
+            with patch.object(fill, 'BLOCK', block):
+                fill.grade(surface, numpy.arange(0x100, dtype=numpy.uint8) * 2)
+                fill.grade(surface, matrix=numpy.eye(3), offset=(1, 0, 0))
+                fill.remap(surface, {(21, 40, 60): (9, 9, 9)})
+            colors = {self.color(surface, (x, y))[:3] for x in range(5) for y in range(7)}
+            self.assertEqual(colors, {(9, 9, 9), (3, 4, 6)})
+            self.assertEqual(self.color(surface, (4, 6))[:3], (3, 4, 6))
+
+
+    def test_fade_alpha(self):
+        surface = pygame.Surface((2, 2), pygame.SRCALPHA, 32)
+        surface.fill((10, 20, 30, 200))
+        fill.fade_alpha(surface, .25)
+        self.assertEqual(self.color(surface, (0, 1)), (10, 20, 30, 50))
+
+
+    def test_grade_lut(self):
+        surface = pygame.Surface((2, 2), 0, 32)
+        surface.fill((10, 20, 30))
+        lut = numpy.arange(0x100, dtype=numpy.uint8)[::-1]
+        fill.grade(surface, lut)
+        self.assertEqual(self.color(surface, (0, 0))[:3], (245, 235, 225))
+
+
+    def test_grade_lut_per_channel(self):
+        surface = pygame.Surface((2, 2), 0, 32)
+        surface.fill((10, 20, 30))
+        identity = numpy.arange(0x100, dtype=numpy.uint8)
+        fill.grade(surface, [identity, identity[::-1], numpy.zeros(0x100)])
+        self.assertEqual(self.color(surface, (0, 0))[:3], (10, 235, 0))
+
+
+    def test_grade_matrix(self):
+        surface = pygame.Surface((2, 2), 0, 32)
+        surface.fill((30, 60, 90))
+        gray = numpy.full((3, 3), 1 / 3)
+        fill.grade(surface, matrix=gray, offset=(10, 0, 0))
+        self.assertEqual(self.color(surface, (0, 0))[:3], (70, 60, 60))
+
+
+    def test_levels(self):
+        self.assertTrue((fill.levels() == numpy.arange(0x100)).all())
+        lut = fill.levels(brightness=1.)
+        self.assertTrue((lut == 0xff).all())
+        lut = fill.levels(gamma=2.)
+        self.assertGreater(lut[64], 64)
+
+
+    def test_remap(self):
+        surface = pygame.Surface((2, 1), pygame.SRCALPHA, 32)
+        surface.set_at((0, 0), (0xff, 0, 0, 0x80))
+        surface.set_at((1, 0), (0, 0xff, 0, 0xff))
+        fill.remap(surface, {(0xff, 0, 0): (0, 0, 0xff), (1, 2, 3): (4, 5, 6)})
+        self.assertEqual(self.color(surface, (0, 0)), (0, 0, 0xff, 0x80))
+        self.assertEqual(self.color(surface, (1, 0)), (0, 0xff, 0, 0xff))
@@ -0,0 +1,86 @@
+import importlib
+import sys
+from types import ModuleType
+from unittest import TestCase
+from unittest.mock import Mock, patch
+import numpy
+from kundalini import Vector, get_dtype, set_dtype
+from kundalini.matrix import Matrix
+
+__all__ = ['TestGL']
+
+
+#-----------------------------------------------------------------------
+class TestGL(TestCase):
+
+    # PyOpenGL is optional: kundalini.gl is imported against stand-in
+    # modules recording the calls
+
+    def setUp(self):
+        self.dtype = get_dtype()
+        self.GL = ModuleType('OpenGL.GL')
+        self.GL.GL_STATIC_DRAW = 0x88e4
+        self.GL.GL_ARRAY_BUFFER = 0x8892
+        self.GL.GL_ELEMENT_ARRAY_BUFFER = 0x8893
+        for name in 'glLoadMatrixf', 'glLoadMatrixd', 'glBufferData':
+            setattr(self.GL, name, Mock())
+        OpenGL = ModuleType('OpenGL')
+        OpenGL.GL = self.GL
+        OpenGL.GLU = ModuleType('OpenGL.GLU')
+
+        modules = patch.dict(sys.modules, {
+            'OpenGL': OpenGL, 'OpenGL.GL': self.GL, 'OpenGL.GLU': OpenGL.GLU,
+        })
+        modules.start()
+        self.addCleanup(modules.stop)
+        sys.modules.pop('kundalini.gl', None)
+        self.gl = importlib.import_module('kundalini.gl')
+
+
+    def tearDown(self):
+        set_dtype(self.dtype)
+        sys.modules.pop('kundalini.gl', None)
+
+
+    def test_load_matrix(self):
+        matrix = Matrix.make_translation(Vector([1, 2, 3]))
+        self.gl.load_matrix(matrix)
+        data, = self.GL.glLoadMatrixd.call_args[0]
+        self.assertEqual(data.dtype, numpy.float64)
+        self.assertEqual(list(data.ravel()[12:15]), [1, 2, 3])
+        self.assertFalse(self.GL.glLoadMatrixf.called)
+
+
+    def test_load_matrix_float32(self):
+        self.gl.load_matrix(numpy.eye(4, dtype=numpy.float32))
+        data, = self.GL.glLoadMatrixf.call_args[0]
+        self.assertEqual(data.dtype, numpy.float32)
+
+
+    def test_load_matrix_library_dtype(self):
+        set_dtype(numpy.float32)
+        self.gl.load_matrix([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+        data, = self.GL.glLoadMatrixf.call_args[0]
+        self.assertTrue(data.flags['C_CONTIGUOUS'])
+
+
+    def test_buffer_data_floats(self):
+        set_dtype(numpy.float32)
+        vertices = numpy.arange(12.)[::2]
+        self.gl.buffer_data(self.GL.GL_ARRAY_BUFFER, vertices)
+        target, size, data, usage = self.GL.glBufferData.call_args[0]
+        self.assertEqual(target, self.GL.GL_ARRAY_BUFFER)
+        self.assertEqual(data.dtype, numpy.float32)
+        self.assertTrue(data.flags['C_CONTIGUOUS'])
+        self.assertEqual(size, 24)
+        self.assertEqual(usage, self.GL.GL_STATIC_DRAW)
+        self.assertEqual(list(data), [0, 2, 4, 6, 8, 10])
+
+
+    def test_buffer_data_indexes(self):
+        indexes = numpy.array([0, 1, 2, 2, 3, 0], numpy.uint16)
+        self.gl.buffer_data(self.GL.GL_ELEMENT_ARRAY_BUFFER, indexes)
+        _, size, data, _ = self.GL.glBufferData.call_args[0]
+        self.assertEqual(data.dtype, numpy.uint16)
+        self.assertEqual(size, 12)
+        self.assertEqual(list(data), [0, 1, 2, 2, 3, 0])
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+from unittest import TestCase
+import kundalini
+
+__all__ = ['TestLazyImport']
+
+
+#-----------------------------------------------------------------------
+class TestLazyImport(TestCase):
+
+    def loaded(self, code:str) -> set:
+        code = '{}; import sys; print(" ".join(sys.modules))'.format(code)
+        process = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True, text=True, check=True,
+        )
+        return set(process.stdout.split())
+
+
+    def test_bare_import(self):
+        modules = self.loaded('import kundalini')
+        self.assertNotIn('numpy', modules)
+        self.assertNotIn('pygame', modules)
+
+
+    def test_math_only(self):
+        modules = self.loaded('from kundalini import Vector, set_dtype')
+        self.assertIn('numpy', modules)
+        self.assertNotIn('pygame', modules)
+        self.assertNotIn('asyncio', modules)
+
+
+    def test_frame_manager(self):
+        modules = self.loaded('from kundalini import FrameManager')
+        self.assertIn('pygame', modules)
+
+
+    def test_public_names(self):
+        for name in kundalini.__all__:
+            self.assertTrue(hasattr(kundalini, name), name)
+
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            kundalini.Unknown
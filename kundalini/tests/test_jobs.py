@@ -0,0 +1,199 @@
+import asyncio
+import time
+from unittest import TestCase
+from unittest.mock import Mock, patch
+from kundalini import FrameManager
+
+__all__ = ['TestJobs']
+
+
+#-----------------------------------------------------------------------
+class Game(FrameManager):
+    build_screen = lambda self: Mock()
+
+
+#-----------------------------------------------------------------------
+class TestJobs(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.game.loop = asyncio.new_event_loop()
+        self.addCleanup(self.game.loop.close)
+
+
+    def test_no_jobs(self):
+        self.assertEqual(self.game._run_jobs(10), 0.)
+
+
+    def test_result(self):
+        def job():
+            yield
+            yield
+            return 42
+
+        future = self.game.schedule(job())
+        self.game._run_jobs(10)
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), 42)
+
+
+    def test_generator_function(self):
+        def job():
+            return 'done'
+            yield
+
+        future = self.game.schedule(job)
+        self.game._run_jobs(10)
+        self.assertEqual(future.result(), 'done')
+
+
+    def test_exception(self):
+        def job():
+            yield
+            raise ValueError
+
+        future = self.game.schedule(job())
+        self.game._run_jobs(10)
+        self.assertIsInstance(future.exception(), ValueError)
+
+
+    def test_budget(self):
+        steps = []
+
+        def job():
+            while True:
+                steps.append(None)
+                time.sleep(.002)
+                yield
+
+        future = self.game.schedule(job())
+        spent = self.game._run_jobs(5)
+        self.assertFalse(future.done())
+        self.assertGreaterEqual(spent, 5)
+        self.assertLess(len(steps), 4)
+        self.assertGreater(len(steps), 0)
+
+
+    def test_priority(self):
+        order = []
+
+        def job(name):
+            order.append(name)
+            return name
+            yield
+
+        self.game.schedule(job('low'), priority=-1)
+        self.game.schedule(job('normal'))
+        self.game.schedule(job('high'), priority=5)
+        self.game._run_jobs(10)
+        self.assertEqual(order, ['high', 'normal', 'low'])
+
+
+    def test_round_robin(self):
+        order = []
+
+        def job(name):
+            for _ in range(2):
+                order.append(name)
+                yield
+
+        self.game.schedule(job('a'))
+        self.game.schedule(job('b'))
+        self.game._run_jobs(10)
+        self.assertEqual(order, ['a', 'b', 'a', 'b'])
+
+
+    def test_cancel(self):
+        closed = []
+
+        def job():
+            try:
+                while True:
+                    yield
+            finally:
+                closed.append(True)
+
+        future = self.game.schedule(job())
+        self.game._run_jobs(1)
+        future.cancel()
+        self.game._run_jobs(1)
+        self.assertEqual(closed, [True])
+        self.assertEqual(self.game._run_jobs(1), 0.)
+
+
+    def test_schedule_from_job(self):
+        order = []
+        futures = []
+
+        def child():
+            order.append('child')
+            yield
+            return 'child'
+
+        def parent():
+            order.append('parent')
+            futures.append(self.game.schedule(child, priority=5))
+            yield
+            order.append('parent')
+            return 'parent'
+
+        future = self.game.schedule(parent)
+        self.game._run_jobs(10)
+        self.assertEqual(order, ['parent', 'child', 'parent'])
+        self.assertEqual(futures[0].result(), 'child')
+        self.assertEqual(future.result(), 'parent')
+        self.assertEqual(self.game._run_jobs(10), 0.)
+
+
+    def test_resolved_elsewhere(self):
+        def job():
+            while True:
+                yield
+
+        future = self.game.schedule(job())
+        future.set_result(None)
+        self.game._run_jobs(1)
+        self.assertEqual(self.game._run_jobs(1), 0.)
+
+
+    @patch('kundalini.frame_management.traceback')
+    @patch('kundalini.frame_management.pygame')
+    def test_draw_callback_job_error(self, pygame:Mock, traceback:Mock):
+        clock = Mock()
+        clock.tick.return_value = 0
+        self.game.screen.get_flags.return_value = 0
+        self.game.loop = Mock()
+
+        with patch.object(Game, '_run_jobs', side_effect=RuntimeError):
+            self.game._draw_callback(clock)
+        self.assertTrue(traceback.print_exc.called)
+        self.game.loop.call_later.assert_called_once_with(
+            1000 / 60 / 1000, self.game._draw_callback, clock,
+        )
+
+
+    @patch('kundalini.frame_management.pygame')
+    def test_draw_callback(self, pygame:Mock):
+        clock = Mock()
+        clock.tick.return_value = 0
+        self.game.screen.get_flags.return_value = 0
+        self.game.loop = Mock()
+
+        with patch.object(Game, '_run_jobs', return_value=3.) as run_jobs:
+            self.game._draw_callback(clock)
+            run_jobs.assert_called_once_with(Game.WORK_BUDGET)
+            self.game.loop.call_later.assert_called_once_with(
+                (1000 / 60 - 3) / 1000, self.game._draw_callback, clock,
+            )
+
+
+    @patch('kundalini.frame_management.pygame')
+    def test_draw_callback_late(self, pygame:Mock):
+        clock = Mock()
+        clock.tick.return_value = 20
+        self.game.screen.get_flags.return_value = 0
+        self.game.loop = Mock()
+
+        with patch.object(Game, '_run_jobs') as run_jobs:
+            self.game._draw_callback(clock)
+            self.assertFalse(run_jobs.called)
@@ -1,8 +1,9 @@
-from unittest import TestCase, skip
+from unittest import TestCase
+import numpy
 from kundalini import Vector
-from kundalini.matrix import Matrix
+from kundalini.matrix import Matrix, Matrix4
 
-__all__ = ['TestMatrix']
+__all__ = ['TestMatrix', 'TestMatrix4']
 
 
 #-----------------------------------------------------------------------
@@ -32,11 +33,133 @@ class TestMatrix(TestCase):
         self.assertTrue((r == v).all())
 
 
-    @skip('TODO')
     def test_make_translation(self):
-        pass
+        m = Matrix.make_translation(Vector([1, 2, 3]))
+        self.assertTrue((m[3] == [1, 2, 3, 1]).all())
+        self.assertTrue((m[:3, :3] == numpy.eye(3)).all())
 
 
-    @skip('TODO')
     def test_make_xyz_rotate(self):
-        pass
+        m = Matrix.make_xyz_rotate(30, 40, 50)
+        self.assertTrue(numpy.allclose(m * m.T, numpy.eye(4)))
+        m = Matrix.make_xyz_rotate(angle_z=90)
+        self.assertTrue(numpy.allclose(m[:2, :2], [[0, 1], [-1, 0]]))
+
+
+#-----------------------------------------------------------------------
+class TestMatrix4(TestCase):
+
+    def test_default_matrix(self):
+        m = Matrix4()
+        self.assertIs(type(m), Matrix4)
+        self.assertTrue((m == numpy.eye(4)).all())
+
+
+    def test_not_4x4(self):
+        with self.assertRaises(ValueError):
+            Matrix4([[1, 0], [0, 1]])
+
+
+    def test_constructors(self):
+        self.assertTrue((
+            Matrix4.make_translation(Vector([1, 2, 3])) == Matrix.make_translation(Vector([1, 2, 3]))
+        ).all())
+        self.assertTrue(numpy.allclose(
+            Matrix4.make_xyz_rotate(30, 40, 50), Matrix.make_xyz_rotate(30, 40, 50),
+        ))
+        self.assertIs(type(Matrix4.make_translation(Vector([1, 2, 3]))), Matrix4)
+
+
+    def test_transform_translation(self):
+        m = Matrix4.make_translation(Vector([1, 2, 3]))
+        r = m.transform(Vector([3, 4, 5]))
+        self.assertIsInstance(r, Vector)
+        self.assertTrue((r == [4, 6, 8]).all())
+
+
+    def test_transform_w(self):
+        m = Matrix4.make_translation(Vector([1, 2, 3]))
+        self.assertTrue((m.transform(Vector([3, 4, 5, 0])) == [3, 4, 5]).all())
+
+
+    def test_transform_batch(self):
+        m = Matrix4.make_xyz_rotate(angle_z=90)
+        points = Vector.batch([[1, 0, 0], [0, 1, 0]])
+        r = m.transform(points)
+        self.assertEqual(r.shape, (2, 3))
+        self.assertTrue(numpy.allclose(r, [[0, 1, 0], [-1, 0, 0]]))
+
+
+    def test_chain(self):
+        rotate = Matrix4.make_xyz_rotate(angle_z=90)
+        translate = Matrix4.make_translation(Vector([1, 0, 0]))
+        m = Matrix4.chain(rotate, translate)
+        self.assertIs(type(m), Matrix4)
+        self.assertTrue(numpy.allclose(m.transform(Vector([1, 0, 0])), [1, 1, 0]))
+        self.assertTrue(numpy.allclose(rotate.then(translate), m))
+
+
+    def test_empty_chain(self):
+        m = Matrix4.chain()
+        self.assertIs(type(m), Matrix4)
+        self.assertTrue((m == numpy.eye(4)).all())
+
+
+    def test_other_shapes(self):
+        m = Matrix4.make_translation(Vector([1, 2, 3]))
+        for result in m[3], m[:, 0], m[:2], m.sum(axis=0), m[3] * 2, m[:2] @ m:
+            self.assertIs(type(result), numpy.ndarray)
+        self.assertEqual(list(m[3]), [1, 2, 3, 1])
+        self.assertIs(type(m[1:3, 1:3]), numpy.ndarray)
+        self.assertIs(type(m.sum()), type(m.dtype.type(0)))
+        self.assertEqual(m.sum(), 10)
+        self.assertEqual(m[3, 0], 1)
+        self.assertIs(type(m[:]), Matrix4)
+        self.assertIs(type(m * 2), Matrix4)
+        self.assertIs(type(m.T), Matrix4)
+        with self.assertRaises(ValueError):
+            m.ravel().inverse()
+        with self.assertRaises(ValueError):
+            m.ravel().transform(Vector([1, 2, 3]))
+
+
+    def test_long_chain(self):
+        matrices = [
+            Matrix4.make_xyz_rotate(i, 2 * i, 3 * i).then(Matrix4.make_translation(Vector([i, 0, 1])))
+            for i in range(11)
+        ]
+        expected = numpy.eye(4)
+        for m in matrices:
+            expected = expected @ m
+        self.assertTrue(numpy.allclose(Matrix4.chain(*matrices), expected))
+
+
+    def test_inverse(self):
+        m = Matrix4.chain(
+            Matrix4([[2, 0, 0, 0], [.5, 1, 0, 0], [0, .3, 4, 0], [0, 0, 0, 1]]),
+            Matrix4.make_xyz_rotate(10, 20, 30),
+            Matrix4.make_translation(Vector([1, 2, 3])),
+        )
+        self.assertIs(type(m.inverse()), Matrix4)
+        self.assertTrue(numpy.allclose(m.inverse(), numpy.linalg.inv(m)))
+
+
+    def test_rigid_inverse(self):
+        m = Matrix4.chain(
+            Matrix4.make_xyz_rotate(10, 20, 30),
+            Matrix4.make_translation(Vector([1, 2, 3])),
+        )
+        self.assertTrue(numpy.allclose(m.inverse(rigid=True) @ m, numpy.eye(4)))
+
+
+    def test_singular(self):
+        with self.assertRaises(numpy.linalg.LinAlgError):
+            Matrix4(numpy.zeros((4, 4))).inverse()
+
+
+    def test_gl_data(self):
+        m = Matrix4.make_translation(Vector([1, 2, 3]))
+        data = m.gl_data
+        self.assertIs(type(data), numpy.ndarray)
+        self.assertTrue(numpy.shares_memory(data, m))
+        self.assertEqual(list(data.ravel()[12:15]), [1, 2, 3])
@@ -0,0 +1,119 @@
+from unittest import TestCase
+import numpy
+import pygame
+from kundalini.particles import ParticleEmitter
+
+__all__ = ['TestParticleEmitter']
+
+
+#-----------------------------------------------------------------------
+class TestParticleEmitter(TestCase):
+
+    def test_emit(self):
+        emitter = ParticleEmitter(10)
+        self.assertEqual(emitter.emit(4, (5, 6)), 4)
+        self.assertEqual(len(emitter), 4)
+        self.assertTrue((emitter.positions[:4] == [5, 6]).all())
+
+
+    def test_capacity(self):
+        emitter = ParticleEmitter(10)
+        self.assertEqual(emitter.emit(15, (0, 0)), 10)
+        self.assertEqual(emitter.emit(1, (0, 0)), 0)
+        self.assertEqual(len(emitter), 10)
+
+
+    def test_update(self):
+        emitter = ParticleEmitter(4, gravity=(0, 10))
+        emitter.emit(1, (0, 0), velocity=(100, 0))
+        emitter.update(500)
+        self.assertTrue(numpy.allclose(emitter.positions[0], [50, 2.5]))
+        self.assertTrue(numpy.allclose(emitter.velocities[0], [100, 5]))
+
+
+    def test_expire_and_recycle(self):
+        emitter = ParticleEmitter(2)
+        positions = emitter.positions
+        emitter.emit(2, (0, 0), lifetime=100)
+        emitter.update(150)
+        self.assertEqual(len(emitter), 0)
+        self.assertEqual(emitter.emit(2, (1, 1)), 2)
+        self.assertIs(emitter.positions, positions)
+
+
+    def test_spread(self):
+        emitter = ParticleEmitter(100, seed=1)
+        emitter.emit(100, (0, 0), velocity=(10, 10), spread=2)
+        self.assertTrue((abs(emitter.velocities - 10) <= 2).all())
+        self.assertFalse((emitter.velocities == 10).all())
+
+
+    def test_draw_pixels(self):
+        surface = pygame.Surface((8, 8), 0, 32)
+        emitter = ParticleEmitter(4)
+        emitter.emit(1, (2, 3), color=(0xff, 0, 0))
+        emitter.emit(1, (20, 3), color=(0, 0xff, 0))
+        emitter.draw(surface)
+        self.assertEqual(tuple(surface.get_at((2, 3)))[:3], (0xff, 0, 0))
+        self.assertEqual(tuple(surface.get_at((3, 3)))[:3], (0, 0, 0))
+
+
+    def test_draw_pixels_24bits(self):
+        surface = pygame.Surface((8, 8), 0, 24)
+        emitter = ParticleEmitter(4)
+        emitter.emit(1, (2, 3), color=(0, 0, 0xff))
+        emitter.draw(surface, offset=(1, 1))
+        self.assertEqual(tuple(surface.get_at((3, 4)))[:3], (0, 0, 0xff))
+
+
+    def test_draw_pixels_16_and_8bits(self):
+        for depth in 16, 8:
+            surface = pygame.Surface((8, 8), 0, depth)
+            emitter = ParticleEmitter(4)
+            emitter.emit(1, (2, 3), color=(0xff, 0, 0))
+            emitter.emit(1, (5, 6), color=(0, 0xff, 0))
+            emitter.draw(surface)
+            self.assertEqual(tuple(surface.get_at((2, 3)))[:3], (0xff, 0, 0))
+            self.assertEqual(surface.get_at_mapped((5, 6)), surface.map_rgb((0, 0xff, 0)))
+            self.assertEqual(surface.get_at_mapped((0, 0)), surface.map_rgb((0, 0, 0)))
+
+
+    def test_draw_pixels_negative(self):
+        surface = pygame.Surface((8, 8), 0, 32)
+        emitter = ParticleEmitter(4)
+        emitter.emit(1, (-.6, 3), color=(0xff, 0, 0))
+        emitter.emit(1, (3, -.2), color=(0xff, 0, 0))
+        emitter.emit(1, (-.6, 3), color=(0, 0xff, 0))
+        emitter.positions[2] = 7.9, 7.9
+        emitter.draw(surface)
+        self.assertEqual(pygame.transform.average_color(surface, (0, 0, 7, 7))[:3], (0, 0, 0))
+        self.assertEqual(tuple(surface.get_at((7, 7)))[:3], (0, 0xff, 0))
+
+
+    def test_draw_pixels_alpha(self):
+        surface = pygame.Surface((8, 8), pygame.SRCALPHA, 32)
+        emitter = ParticleEmitter(4)
+        emitter.emit(1, (2, 3), color=(0, 0xff, 0))
+        emitter.draw(surface)
+        self.assertEqual(tuple(surface.get_at((2, 3))), (0, 0xff, 0, 0xff))
+
+
+    def test_draw_image(self):
+        surface = pygame.Surface((8, 8), 0, 32)
+        image = pygame.Surface((2, 2), 0, 32)
+        image.fill((0, 0, 0xff))
+        emitter = ParticleEmitter(4, image=image)
+        emitter.emit(1, (4, 4))
+        emitter.draw(surface)
+        self.assertEqual(tuple(surface.get_at((5, 5)))[:3], (0, 0, 0xff))
+
+
+    def test_draw_image_negative(self):
+        surface = pygame.Surface((8, 8), 0, 32)
+        image = pygame.Surface((2, 2), 0, 32)
+        image.fill((0, 0, 0xff))
+        emitter = ParticleEmitter(4, image=image)
+        emitter.emit(1, (-.5, 4))
+        emitter.draw(surface)
+        self.assertEqual(tuple(surface.get_at((0, 4)))[:3], (0, 0, 0xff))
+        self.assertEqual(tuple(surface.get_at((1, 4)))[:3], (0, 0, 0))
@@ -0,0 +1,144 @@
+from itertools import combinations
+from unittest import TestCase
+import numpy
+from kundalini.physics import Bodies, SemiImplicitEuler, Verlet, sweep_and_prune
+
+__all__ = ['TestIntegrators', 'TestSweepAndPrune']
+
+
+#-----------------------------------------------------------------------
+class TestIntegrators(TestCase):
+
+    def test_euler(self):
+        bodies = Bodies(2)
+        bodies.velocities[0] = 10, 0
+        SemiImplicitEuler(bodies, gravity=(0, 10)).update(1000)
+        self.assertTrue(numpy.allclose(bodies.velocities[0], [10, 10]))
+        self.assertTrue(numpy.allclose(bodies.positions[0], [10, 10]))
+        self.assertTrue(numpy.allclose(bodies.positions[1], [0, 10]))
+
+
+    def test_substeps(self):
+        bodies = Bodies(1)
+        SemiImplicitEuler(bodies, gravity=(0, 10), substeps=4).update(1000)
+        self.assertTrue(numpy.allclose(bodies.velocities[0], [0, 10]))
+        # Σ 10·k/4 · 1/4 for k in 1..4
+        self.assertTrue(numpy.allclose(bodies.positions[0], [0, 6.25]))
+
+
+    def test_forces(self):
+        bodies = Bodies(2)
+        bodies.inverse_masses[:] = 1, .5
+        bodies.forces[:] = [2, 0], [2, 0]
+        SemiImplicitEuler(bodies).update(1000)
+        self.assertTrue(numpy.allclose(bodies.velocities, [[2, 0], [1, 0]]))
+        self.assertTrue((bodies.forces == 0).all())
+
+
+    def test_static_body(self):
+        bodies = Bodies(1)
+        bodies.inverse_masses[:] = 0
+        bodies.forces[:] = 100, 100
+        SemiImplicitEuler(bodies).update(1000)
+        self.assertTrue((bodies.positions == 0).all())
+
+
+    def test_verlet(self):
+        bodies = Bodies(1, 3)
+        bodies.velocities[0] = 1, 2, 3
+        integrator = Verlet(bodies, gravity=(0, -10, 0), substeps=10)
+        integrator.update(1000)
+        self.assertTrue(numpy.allclose(bodies.velocities[0], [1, -8, 3]))
+        # Verlet matches the exact trajectory under constant acceleration
+        # up to the first step error
+        self.assertTrue(numpy.allclose(bodies.positions[0], [1, -3, 3], atol=.6))
+        integrator.update(1000)
+        self.assertTrue(numpy.allclose(bodies.velocities[0], [1, -18, 3]))
+
+
+    def test_verlet_frame_time_changes(self):
+        bodies = Bodies(1)
+        bodies.velocities[0] = 100, 0
+        integrator = Verlet(bodies)
+        integrator.update(10)
+        integrator.update(20)
+        self.assertTrue(numpy.allclose(bodies.positions[0], [3, 0]))
+        self.assertTrue(numpy.allclose(bodies.velocities[0], [100, 0]))
+
+
+    def test_verlet_velocity_change(self):
+        bodies = Bodies(1)
+        integrator = Verlet(bodies)
+        integrator.update(100)
+        bodies.velocities[0] = 0, -50
+        integrator.update(100)
+        self.assertTrue(numpy.allclose(bodies.positions[0], [0, -5]))
+        self.assertTrue(numpy.allclose(bodies.velocities[0], [0, -50]))
+
+
+    def test_verlet_moved_by_hand(self):
+        bodies = Bodies(1)
+        integrator = Verlet(bodies)
+        integrator.update(100)
+        bodies.positions[0] = 50, 50
+        integrator.update(100)
+        self.assertTrue(numpy.allclose(bodies.positions[0], [50, 50]))
+        self.assertTrue(numpy.allclose(bodies.velocities[0], [0, 0]))
+
+
+#-----------------------------------------------------------------------
+class TestSweepAndPrune(TestCase):
+
+    def brute_force(self, positions, radii) -> set:
+        return {
+            (i, j)
+            for i, j in combinations(range(len(positions)), 2)
+            if numpy.sum((positions[i] - positions[j]) ** 2) < (radii[i] + radii[j]) ** 2
+        }
+
+
+    def test_pairs(self):
+        positions = numpy.array([[0., 0.], [1.5, 0.], [10., 0.], [1., 1.5]])
+        radii = numpy.ones(4)
+        pairs = sweep_and_prune(positions, radii)
+        self.assertEqual({tuple(pair) for pair in pairs}, {(0, 1), (0, 3), (1, 3)})
+
+
+    def test_empty(self):
+        self.assertEqual(sweep_and_prune(numpy.zeros((1, 2)), numpy.ones(1)).shape, (0, 2))
+        positions = numpy.array([[0., 0.], [5., 0.]])
+        self.assertEqual(sweep_and_prune(positions, numpy.ones(2)).shape, (0, 2))
+
+
+    def test_random(self):
+        random = numpy.random.default_rng(0)
+        positions = random.uniform(0, 50, (300, 2))
+        radii = random.uniform(.5, 2, 300)
+        expected = self.brute_force(positions, radii)
+        for axis in (0, 1):
+            pairs = sweep_and_prune(positions, radii, axis)
+            self.assertEqual({tuple(pair) for pair in pairs.tolist()}, expected)
+            self.assertEqual(len(pairs), len(expected))
+
+
+    def test_bodies(self):
+        bodies = Bodies(2)
+        bodies.positions[1] = 1, 0
+        self.assertEqual(bodies.collisions().tolist(), [[0, 1]])
+
+
+    def test_large_body(self):
+        random = numpy.random.default_rng(1)
+        positions = random.uniform(0, 100, (200, 2))
+        radii = numpy.full(200, .5)
+        radii[17] = 40
+        pairs = sweep_and_prune(positions, radii)
+        self.assertEqual({tuple(pair) for pair in pairs.tolist()}, self.brute_force(positions, radii))
+
+
+    def test_3d(self):
+        random = numpy.random.default_rng(2)
+        positions = random.uniform(0, 20, (200, 3))
+        radii = numpy.ones(200)
+        pairs = sweep_and_prune(positions, radii, axis=2)
+        self.assertEqual({tuple(pair) for pair in pairs.tolist()}, self.brute_force(positions, radii))
@@ -0,0 +1,240 @@
+import asyncio
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, patch
+from kundalini import FrameManager, Scene
+
+__all__ = ['TestScene']
+
+
+#-----------------------------------------------------------------------
+class Game(FrameManager):
+    build_screen = lambda self: Mock()
+
+
+#-----------------------------------------------------------------------
+class Level(Scene):
+
+    def __init__(self):
+        self.calls = []
+
+
+    def load(self):
+        self.calls.append('load')
+
+
+    def unload(self):
+        self.calls.append('unload')
+
+
+    def suspend(self):
+        self.calls.append('suspend')
+
+
+    def resume(self):
+        self.calls.append('resume')
+
+
+#-----------------------------------------------------------------------
+class TestScene(TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.game.loop = asyncio.new_event_loop()
+        self.addCleanup(self.game.loop.close)
+
+
+    def run_loop(self, future:asyncio.Future) -> None:
+        self.game.loop.run_until_complete(future)
+        # Let done callbacks run
+        self.game.loop.run_until_complete(asyncio.sleep(0))
+
+
+    def test_no_scene(self):
+        self.assertIsNone(self.game.scene)
+        self.assertIs(self.game._target, self.game)
+
+
+    def test_push(self):
+        level = Level()
+        self.game.push_scene(level)
+        self.assertIs(self.game.scene, level)
+        self.assertIs(level.manager, self.game)
+        self.assertTrue(level.loaded)
+        self.assertEqual(level.calls, ['load', 'resume'])
+        self.assertIs(level.screen, self.game.screen)
+
+
+    def test_push_suspends(self):
+        first, second = Level(), Level()
+        self.game.push_scene(first)
+        self.game.push_scene(second)
+        self.assertIs(self.game.scene, second)
+        self.assertEqual(first.calls, ['load', 'resume', 'suspend'])
+
+
+    def test_pop(self):
+        first, second = Level(), Level()
+        self.game.push_scene(first)
+        self.game.push_scene(second)
+        self.assertIs(self.game.pop_scene(), second)
+        self.assertIs(self.game.scene, first)
+        self.assertFalse(second.loaded)
+        self.assertEqual(second.calls, ['load', 'resume', 'suspend', 'unload'])
+        self.assertEqual(first.calls[-1], 'resume')
+
+
+    def test_pop_empty(self):
+        with self.assertRaises(IndexError):
+            self.game.pop_scene()
+        level = Level()
+        self.game.push_scene(level)
+        self.game.pop_scene()
+        with self.assertRaises(IndexError):
+            self.game.pop_scene()
+        self.assertEqual(level.calls, ['load', 'resume', 'suspend', 'unload'])
+
+
+    def test_replace(self):
+        first, second = Level(), Level()
+        self.game.push_scene(first)
+        self.game.replace_scene(second)
+        self.assertIs(self.game.scene, second)
+        self.assertEqual(first.calls, ['load', 'resume', 'suspend', 'unload'])
+        self.game.pop_scene()
+        self.assertIsNone(self.game.scene)
+
+
+    def test_preload_thread(self):
+        level = Level()
+        loaded = threading.Event()
+        release = threading.Event()
+
+        def load():
+            loaded.set()
+            release.wait(5)
+        level.load = load
+
+        future = self.game.preload(level)
+        self.assertTrue(loaded.wait(5))
+        self.assertFalse(level.loaded)
+        self.assertIs(self.game.preload(level), future)
+
+        self.game.push_scene(level)
+        self.assertIsNone(self.game.scene)
+        release.set()
+        self.run_loop(future)
+        self.assertTrue(level.loaded)
+        self.assertIs(self.game.scene, level)
+
+
+    def test_push_while_preloading(self):
+        first, level = Level(), Level()
+        release = threading.Event()
+        level.load = lambda: release.wait(5)
+        self.game.push_scene(first)
+
+        future = self.game.preload(level)
+        self.game.push_scene(level)
+        self.game.push_scene(level)
+        self.game.replace_scene(level)
+        release.set()
+        self.run_loop(future)
+        self.assertIs(self.game.scene, level)
+        self.assertEqual(level.calls, ['resume'])
+        self.assertEqual(first.calls, ['load', 'resume', 'suspend', 'unload'])
+        self.game.pop_scene()
+        self.assertIsNone(self.game.scene)
+
+
+    def test_preloaded(self):
+        level = Level()
+        self.run_loop(self.game.preload(level))
+        self.assertTrue(level.loaded)
+        self.game.push_scene(level)
+        self.assertIs(self.game.scene, level)
+        self.assertEqual(level.calls, ['load', 'resume'])
+
+
+    def test_coroutine_load(self):
+        level = Level()
+
+        async def load():
+            await asyncio.sleep(0)
+            level.calls.append('load')
+        level.load = load
+
+        self.game.push_scene(level)
+        self.assertIsNone(self.game.scene)
+        self.game.loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertIs(self.game.scene, level)
+
+
+    def test_generator_load(self):
+        level = Level()
+
+        def load():
+            yield
+            level.calls.append('load')
+        level.load = load
+
+        self.game.push_scene(level)
+        self.assertIsNone(self.game.scene)
+        self.assertFalse(level.loaded)
+        self.game.loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertIs(self.game.scene, level)
+        self.assertEqual(level.calls, ['load', 'resume'])
+
+
+    def test_generator_preload(self):
+        level = Level()
+
+        def load():
+            future = self.game.loop.create_future()
+            self.game.loop.call_soon(future.set_result, 'load')
+            level.calls.append((yield from future))
+        level.load = load
+
+        self.run_loop(self.game.preload(level))
+        self.assertTrue(level.loaded)
+        self.assertEqual(level.calls, ['load'])
+
+
+    @patch('kundalini.frame_management.traceback')
+    def test_preload_error(self, traceback:Mock):
+        level = Level()
+        level.load = Mock(side_effect=ValueError)
+        future = self.game.preload(level)
+        self.game.push_scene(level)
+        with self.assertRaises(ValueError):
+            self.run_loop(future)
+        self.game.loop.run_until_complete(asyncio.sleep(0))
+        self.assertIsNone(self.game.scene)
+        self.assertFalse(level.loaded)
+        self.assertTrue(traceback.print_exception.called)
+
+
+    @patch('kundalini.frame_management.pygame')
+    def test_dispatch(self, pygame:Mock):
+        level = Level()
+        level.update = Mock()
+        level.draw = Mock()
+        level.handle_event = Mock()
+        self.game.loop = Mock()
+        self.game.push_scene(level)
+
+        with patch.object(Game, 'update') as update, patch.object(Game, 'draw') as draw:
+            clock = Mock()
+            clock.tick.return_value = 10
+            self.game._update_callback(clock)
+            self.game._draw_callback(clock)
+            level.update.assert_called_once_with(milliseconds=10)
+            level.draw.assert_called_once_with()
+            self.assertFalse(update.called)
+            self.assertFalse(draw.called)
+
+        event = Mock()
+        event.type = None
+        pygame.event.get.return_value = [event]
+        self.game._event_callback()
+        level.handle_event.assert_called_once_with(event)
@@ -0,0 +1,80 @@
+from unittest import TestCase
+import pygame
+from kundalini.text import TextRenderer
+
+__all__ = ['TestTextRenderer']
+
+
+#-----------------------------------------------------------------------
+class TestTextRenderer(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+
+    def setUp(self):
+        self.font = pygame.font.Font(None, 16)
+
+
+    def test_render_cached(self):
+        renderer = TextRenderer(self.font)
+        surface = renderer.render('Score: 10', (0xff, 0xff, 0xff))
+        self.assertIs(renderer.render('Score: 10', [0xff, 0xff, 0xff]), surface)
+        self.assertEqual(renderer.string_stats, (1, 1, 1))
+        self.assertEqual(renderer.string_stats.hit_rate, .5)
+
+
+    def test_render_color(self):
+        renderer = TextRenderer(self.font)
+        white = renderer.render('a', (0xff, 0xff, 0xff))
+        self.assertIsNot(renderer.render('a', (0xff, 0, 0)), white)
+
+
+    def test_render_lru(self):
+        renderer = TextRenderer(self.font, capacity=2)
+        a = renderer.render('a', (0, 0, 0))
+        renderer.render('b', (0, 0, 0))
+        renderer.render('a', (0, 0, 0))
+        renderer.render('c', (0, 0, 0))
+        self.assertEqual(renderer.string_stats.size, 2)
+        self.assertIs(renderer.render('a', (0, 0, 0)), a)
+        renderer.render('b', (0, 0, 0))
+        self.assertEqual(renderer.string_stats.misses, 4)
+
+
+    def test_draw(self):
+        renderer = TextRenderer(self.font)
+        target = pygame.Surface((200, 40), 0, 32)
+        rect = renderer.draw(target, '1010', (5, 5), (0xff, 0xff, 0xff))
+        self.assertEqual(rect.topleft, (5, 5))
+        self.assertEqual(rect.width, 2 * sum(renderer.glyph(c, (0xff, 0xff, 0xff)).get_width() for c in '10'))
+        self.assertEqual(renderer.glyph_stats.size, 2)
+        self.assertEqual(renderer.glyph_stats.misses, 2)
+        self.assertNotEqual(pygame.transform.average_color(target, rect)[:3], (0, 0, 0))
+        self.assertEqual(tuple(target.get_at((0, 0)))[:3], (0, 0, 0))
+
+
+    def test_glyph_lru(self):
+        renderer = TextRenderer(self.font, glyph_capacity=2)
+        a = renderer.glyph('a', (0, 0, 0))
+        renderer.glyph('a', (1, 1, 1))
+        renderer.glyph('a', (0, 0, 0))
+        renderer.glyph('a', (2, 2, 2))
+        self.assertEqual(renderer.glyph_stats.size, 2)
+        self.assertIs(renderer.glyph('a', (0, 0, 0)), a)
+        renderer.glyph('a', (1, 1, 1))
+        self.assertEqual(renderer.glyph_stats.misses, 4)
+
+
+    def test_stats_empty(self):
+        self.assertEqual(TextRenderer(self.font).glyph_stats.hit_rate, 0.)
+
+
+    def test_clear(self):
+        renderer = TextRenderer(self.font)
+        renderer.render('a', (0, 0, 0))
+        renderer.draw(pygame.Surface((10, 10)), 'a', (0, 0), (0, 0, 0))
+        renderer.clear()
+        self.assertEqual(renderer.string_stats.size, 0)
+        self.assertEqual(renderer.glyph_stats.size, 0)
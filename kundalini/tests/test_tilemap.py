@@ -0,0 +1,102 @@
+from unittest import TestCase
+import pygame
+from kundalini.tilemap import TileMap
+
+__all__ = ['TestTileMap']
+
+
+#-----------------------------------------------------------------------
+class TestTileMap(TestCase):
+
+    def setUp(self):
+        self.tileset = []
+        for color in [(0xff, 0, 0), (0, 0xff, 0)]:
+            tile = pygame.Surface((2, 2), 0, 32)
+            tile.fill(color)
+            self.tileset.append(tile)
+        self.tiles = [[(x + y) % 2 for x in range(8)] for y in range(6)]
+
+
+    def test_size(self):
+        tilemap = TileMap(self.tiles, self.tileset, (2, 2), chunk_size=4)
+        self.assertEqual(tilemap.size, (16, 12))
+        self.assertEqual(tilemap[1, 0], 1)
+
+
+    def test_draw(self):
+        tilemap = TileMap(self.tiles, self.tileset, (2, 2), chunk_size=4)
+        surface = pygame.Surface((16, 12), 0, 32)
+        tilemap.draw(surface)
+        self.assertEqual(len(tilemap), 4)
+        self.assertEqual(tuple(surface.get_at((0, 0)))[:3], (0xff, 0, 0))
+        self.assertEqual(tuple(surface.get_at((2, 0)))[:3], (0, 0xff, 0))
+        self.assertEqual(tuple(surface.get_at((15, 11)))[:3], (0xff, 0, 0))
+
+
+    def test_viewport(self):
+        tilemap = TileMap(self.tiles, self.tileset, (2, 2), chunk_size=4)
+        surface = pygame.Surface((4, 4), 0, 32)
+        tilemap.draw(surface, pygame.Rect(2, 0, 4, 4))
+        self.assertEqual(len(tilemap), 1)
+        self.assertEqual(tuple(surface.get_at((0, 0)))[:3], (0, 0xff, 0))
+
+
+    def test_viewport_crossing_chunks(self):
+        tilemap = TileMap(self.tiles, self.tileset, (2, 2), chunk_size=4)
+        surface = pygame.Surface((4, 4), 0, 32)
+        tilemap.draw(surface, pygame.Rect(6, 0, 4, 4))
+        self.assertEqual(len(tilemap), 2)
+        self.assertEqual(tuple(surface.get_at((2, 0)))[:3], (0xff, 0, 0))
+
+
+    def test_redraw_changed_chunk(self):
+        tilemap = TileMap(self.tiles, self.tileset, (2, 2), chunk_size=4)
+        surface = pygame.Surface((16, 12), 0, 32)
+        tilemap.draw(surface)
+        tilemap[0, 0] = 1
+        tilemap.draw(surface)
+        self.assertEqual(tuple(surface.get_at((0, 0)))[:3], (0, 0xff, 0))
+
+
+    def test_empty_tile(self):
+        self.tiles[0][0] = TileMap.EMPTY
+        tilemap = TileMap(self.tiles, self.tileset, (2, 2), chunk_size=4)
+        surface = pygame.Surface((16, 12), 0, 32)
+        surface.fill((0, 0, 0xff))
+        tilemap.draw(surface)
+        self.assertEqual(tuple(surface.get_at((0, 0)))[:3], (0, 0, 0xff))
+        self.assertEqual(tuple(surface.get_at((2, 0)))[:3], (0, 0xff, 0))
+
+
+    def test_dest_clipped(self):
+        tilemap = TileMap(self.tiles, self.tileset, (2, 2), chunk_size=4)
+        surface = pygame.Surface((20, 20), 0, 32)
+        surface.fill((0, 0, 0xff))
+        surface.set_clip(pygame.Rect(0, 0, 18, 18))
+        tilemap.draw(surface, pygame.Rect(2, 2, 4, 4), (10, 10))
+        self.assertEqual(tuple(surface.get_at((10, 10)))[:3], (0xff, 0, 0))
+        self.assertEqual(tuple(surface.get_at((13, 13)))[:3], (0xff, 0, 0))
+        for point in [(8, 8), (9, 10), (14, 10), (10, 14)]:
+            self.assertEqual(tuple(surface.get_at(point))[:3], (0, 0, 0xff))
+        self.assertEqual(surface.get_clip(), pygame.Rect(0, 0, 18, 18))
+
+
+    def test_viewport_past_edges(self):
+        tilemap = TileMap(self.tiles, self.tileset, (2, 2), chunk_size=4)
+        surface = pygame.Surface((12, 8), 0, 32)
+        surface.fill((0, 0, 0xff))
+        tilemap.draw(surface, pygame.Rect(-4, -2, 12, 8))
+        self.assertEqual(tuple(surface.get_at((3, 3)))[:3], (0, 0, 0xff))
+        self.assertEqual(tuple(surface.get_at((5, 1)))[:3], (0, 0, 0xff))
+        self.assertEqual(tuple(surface.get_at((4, 2)))[:3], (0xff, 0, 0))
+        self.assertEqual(tuple(surface.get_at((6, 2)))[:3], (0, 0xff, 0))
+
+
+    def test_budget(self):
+        # Top chunks take 8x8 pixels, 4 bytes each; bottom ones 8x4
+        tilemap = TileMap(self.tiles, self.tileset, (2, 2), chunk_size=4, budget=384)
+        surface = pygame.Surface((16, 12), 0, 32)
+        tilemap.draw(surface)
+        self.assertEqual(len(tilemap), 2)
+        self.assertLessEqual(tilemap.memory, 384)
+        self.assertEqual(tuple(surface.get_at((0, 0)))[:3], (0xff, 0, 0))
@@ -0,0 +1,99 @@
+from collections import OrderedDict, namedtuple
+import pygame
+
+__all__ = ['CacheStats', 'TextRenderer']
+
+Font = pygame.font.Font
+Rect = pygame.rect.Rect
+Surface = pygame.surface.Surface
+
+
+#-----------------------------------------------------------------------
+class CacheStats(namedtuple('CacheStats', 'hits misses size')):
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.
+
+
+#-----------------------------------------------------------------------
+class TextRenderer:
+
+    def __init__(self, font:Font, *, antialias:bool=True,
+                 capacity:int=256, glyph_capacity:int=256):
+        self.font = font
+        self.antialias = antialias
+        self.capacity = capacity
+        self.glyph_capacity = glyph_capacity
+        self.__strings = OrderedDict()
+        self.__glyphs = OrderedDict()
+        self.__string_hits = self.__string_misses = 0
+        self.__glyph_hits = self.__glyph_misses = 0
+
+
+    @property
+    def string_stats(self) -> CacheStats:
+        return CacheStats(self.__string_hits, self.__string_misses, len(self.__strings))
+
+
+    @property
+    def glyph_stats(self) -> CacheStats:
+        return CacheStats(self.__glyph_hits, self.__glyph_misses, len(self.__glyphs))
+
+
+    def render(self, text:str, color:tuple, background:tuple=None) -> Surface:
+        # Whole strings, least recently used evicted past capacity
+        key = text, tuple(color), background and tuple(background)
+        strings = self.__strings
+        surface = strings.get(key)
+
+        if surface is None:
+            self.__string_misses += 1
+            surface = self.font.render(text, self.antialias, color, background)
+            strings[key] = surface
+            if len(strings) > self.capacity:
+                strings.popitem(last=False)
+
+        else:
+            self.__string_hits += 1
+            strings.move_to_end(key)
+
+        return surface
+
+
+    def draw(self, target:Surface, text:str, dest:tuple, color:tuple) -> Rect:
+        # Composed from cached glyphs: suited for text changing every
+        # frame, like counters, at the cost of kerning
+        x, y = dest
+        blits = []
+        for char in text:
+            glyph = self.glyph(char, color)
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        target.blits(blits, doreturn=False)
+        return Rect(dest, (x - dest[0], self.font.get_height()))
+
+
+    def glyph(self, char:str, color:tuple) -> Surface:
+        # Keyed by colour too: fading text would grow it without bound
+        key = char, tuple(color)
+        glyphs = self.__glyphs
+        glyph = glyphs.get(key)
+
+        if glyph is None:
+            self.__glyph_misses += 1
+            glyph = glyphs[key] = self.font.render(char, self.antialias, color)
+            if len(glyphs) > self.glyph_capacity:
+                glyphs.popitem(last=False)
+
+        else:
+            self.__glyph_hits += 1
+            glyphs.move_to_end(key)
+
+        return glyph
+
+
+    def clear(self) -> None:
+        self.__strings.clear()
+        self.__glyphs.clear()
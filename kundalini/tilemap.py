@@ -0,0 +1,145 @@
+from collections import OrderedDict
+import numpy
+import pygame
+
+__all__ = ['TileMap']
+
+Rect = pygame.rect.Rect
+Surface = pygame.surface.Surface
+
+
+#-----------------------------------------------------------------------
+class TileMap:
+
+    EMPTY = -1
+
+    def __init__(self, tiles, tileset:list, tile_size:tuple, *,
+                 chunk_size:int=16, budget:int=64 * 2**20, flags:int=pygame.SRCALPHA):
+        self.tiles = numpy.array(tiles, numpy.int32)
+        self.tileset = tileset
+        self.tile_size = tuple(tile_size)
+        self.chunk_size = chunk_size
+        self.budget = budget
+        self.flags = flags
+        self.memory = 0
+        # Least recently drawn chunks first
+        self.__chunks = OrderedDict()
+        self.__dirty = set()
+
+
+    @property
+    def size(self) -> tuple:
+        rows, columns = self.tiles.shape
+        width, height = self.tile_size
+        return columns * width, rows * height
+
+
+    def __len__(self) -> int:
+        return len(self.__chunks)
+
+
+    def __getitem__(self, position:tuple) -> int:
+        x, y = position
+        return int(self.tiles[y, x])
+
+
+    def __setitem__(self, position:tuple, tile:int) -> None:
+        x, y = position
+        if self.tiles[y, x] != tile:
+            self.tiles[y, x] = tile
+            chunk = x // self.chunk_size, y // self.chunk_size
+            if chunk in self.__chunks:
+                self.__dirty.add(chunk)
+
+
+    def invalidate(self) -> None:
+        self.__dirty.update(self.__chunks)
+
+
+    def draw(self, surface:Surface, viewport:Rect=None, dest:tuple=(0, 0)) -> None:
+        if viewport is None:
+            viewport = Rect((0, 0), surface.get_size())
+        # The viewport may reach past the map edges: only the visible part
+        # picks chunks, while placement follows the viewport as given
+        visible = viewport.clip(Rect((0, 0), self.size))
+        if not visible.width or not visible.height:
+            return
+
+        tile_width, tile_height = self.tile_size
+        chunk_width = tile_width * self.chunk_size
+        chunk_height = tile_height * self.chunk_size
+        left = visible.left // chunk_width
+        right = (visible.right - 1) // chunk_width
+        top = visible.top // chunk_height
+        bottom = (visible.bottom - 1) // chunk_height
+        x0 = dest[0] - viewport.left
+        y0 = dest[1] - viewport.top
+
+        # Whole chunks are blitted: clipped to the viewport on target
+        clip = surface.get_clip()
+        surface.set_clip(clip.clip(Rect(dest, viewport.size)))
+        try:
+            surface.blits([
+                (self.__chunk((cx, cy)), (x0 + cx * chunk_width, y0 + cy * chunk_height))
+                for cy in range(top, bottom + 1)
+                for cx in range(left, right + 1)
+            ], doreturn=False)
+        finally:
+            surface.set_clip(clip)
+
+
+    #---------------------------------------------------------------
+    # Internals
+    #
+
+    def __chunk(self, chunk:tuple) -> Surface:
+        chunks = self.__chunks
+        image = chunks.get(chunk)
+
+        if image is None:
+            image = self.__render(chunk, None)
+            chunks[chunk] = image
+            self.memory += self.__bytes(image)
+            self.__evict()
+
+        else:
+            chunks.move_to_end(chunk)
+            if chunk in self.__dirty:
+                self.__render(chunk, image)
+
+        self.__dirty.discard(chunk)
+        return image
+
+
+    def __render(self, chunk:tuple, image:Surface) -> Surface:
+        size = self.chunk_size
+        cx, cy = chunk
+        tiles = self.tiles[cy * size:(cy + 1) * size, cx * size:(cx + 1) * size]
+        rows, columns = tiles.shape
+        tile_width, tile_height = self.tile_size
+
+        if image is None:
+            image = Surface((columns * tile_width, rows * tile_height), self.flags)
+        image.fill((0, 0, 0, 0))
+
+        tileset = self.tileset
+        image.blits([
+            (tileset[tile], (x * tile_width, y * tile_height))
+            for (y, x), tile in numpy.ndenumerate(tiles)
+            if tile != self.EMPTY
+        ], doreturn=False)
+        return image
+
+
+    def __evict(self) -> None:
+        # The chunk just rendered is never evicted, even over budget
+        chunks = self.__chunks
+        while self.memory > self.budget and len(chunks) > 1:
+            chunk, image = chunks.popitem(last=False)
+            self.__dirty.discard(chunk)
+            self.memory -= self.__bytes(image)
+
+
+    @staticmethod
+    def __bytes(image:Surface) -> int:
+        return image.get_bytesize() * image.get_width() * image.get_height()
@@ -2,6 +2,7 @@ import math
 from numbers import Number
 from numpy import array
 from collections import namedtuple
+from .dtype import get_dtype, gl_array
 
 __all__ = ['Vector']
 
@@ -12,13 +13,11 @@ ndarray = type(array([]))
 class VectorMeta(type):
 
     def __call__(cls, values):
-        if isinstance(values, (list, tuple)):
-            self = type.__call__(cls, len(values), float)
-            for i, v in enumerate(values):
-                self[i] = v
+        if isinstance(values, (list, tuple, ndarray)):
+            self = array(values, dtype=get_dtype()).view(cls)
 
         else:
-            self = type.__call__(cls, values)
+            self = type.__call__(cls, values, get_dtype())
 
         return self
 
@@ -86,6 +85,19 @@ class Vector(ndarray, metaclass=VectorMeta):
         return tuple(map(math.degrees, angles))
 
 
+    #---------------------------------------------------------------
+    @property
+    def gl_data(self) -> ndarray:
+        return gl_array(self)
+
+
+    #---------------------------------------------------------------
+    @classmethod
+    def batch(cls, values) -> ndarray:
+        # Vectors packed as rows of one contiguous (n, dimensions) block
+        return gl_array(values)
+
+
     #---------------------------------------------------------------
     @classmethod
     def from_angles(cls, angles:tuple, *, magnitude:float=1.) -> namedtuple:
@@ -22,7 +22,8 @@ setup(
     author_email='batalema@cacilhas.info',
     description='LÖVE-like PyGame API',
     long_description=long_description,
-    install_requires=['pygame>=1.9.1'],
+    install_requires=['pygame>=1.9.1', 'numpy'],
+    extras_require={'gl': ['PyOpenGL']},
     test_suite='kundalini.tests',
     classifiers=[
         'License :: OSI Approved :: BSD License',